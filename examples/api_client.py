@@ -5,14 +5,54 @@ This example demonstrates how to use the DB Facade Service API to
 interact with the database using obfuscated field names.
 """
 
-import json
+import asyncio
 import os
-import requests
-import uuid
 from typing import Dict, Any, List
 
+import httpx
+import orjson
+
 from indaleko_dbfacade.config import DBFacadeConfig
 from indaleko_dbfacade.models import ObfuscatedModel
+from indaleko_dbfacade.uuid_pool import uuid4
+
+
+# Request bodies are serialized with orjson rather than httpx's stdlib json encoder
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Options for pretty-printing responses in the demo output
+PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+
+def pretty(data: Any) -> str:
+    """
+    Format data as indented JSON for display.
+    
+    Args:
+        data: The data to format
+        
+    Returns:
+        The indented JSON text
+    """
+    return orjson.dumps(data, option=PRETTY_OPTIONS, default=str).decode()
+
+
+def _build_client(api_url: str) -> httpx.AsyncClient:
+    """
+    Build an async client that keeps connections to the API alive between calls.
+    
+    Args:
+        api_url: Base URL of the DB Facade Service
+        
+    Returns:
+        An async client with a pooled, retrying transport
+    """
+    return httpx.AsyncClient(
+        base_url=api_url,
+        headers=JSON_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        transport=httpx.AsyncHTTPTransport(retries=3),
+    )
 
 
 # Example model using ObfuscatedModel
@@ -25,29 +65,41 @@ class Product(ObfuscatedModel):
     in_stock: bool
 
 
-def main() -> None:
+async def main() -> None:
     """Example usage of the DB Facade Service API."""
     # Configure the API
     api_url = "http://localhost:8000"
     
     print("DB Facade Service API Example\n")
     
+    async with _build_client(api_url) as client:
+        await run_example(client, api_url)
+
+
+async def run_example(client: httpx.AsyncClient, api_url: str) -> None:
+    """
+    Run the example requests against the API.
+    
+    Args:
+        client: Async client bound to the API base URL
+        api_url: Base URL of the API, used in messages
+    """
     # Check if the API is running
     try:
-        response = requests.get(f"{api_url}/health")
+        response = await client.get("/health")
         if response.status_code != 200:
             print(f"API is not available at {api_url}")
             return
             
-        health_data = response.json()
+        health_data = orjson.loads(response.content)
         print(f"API is running in {health_data['mode']} mode")
-    except requests.exceptions.RequestException:
+    except httpx.HTTPError:
         print(f"API is not available at {api_url}")
         return
     
     # Register a collection UUID
     # In a real application, this would come from the registry service
-    collection_uuid = uuid.uuid4()
+    collection_uuid = uuid4()
     print(f"\nUsing collection UUID: {collection_uuid}")
     
     # Create a product with semantic field names
@@ -59,80 +111,110 @@ def main() -> None:
     )
     
     # Get the UUID-mapped data for the product
-    product_data = product.model_dump()
+    product_data = product.model_dump(mode="json")
     print("\nProduct with UUID-mapped fields:")
-    print(json.dumps(product_data, indent=2))
+    print(product.model_dump_json(indent=2))
     
     # Submit the product to the database
     try:
-        response = requests.post(
-            f"{api_url}/record",
-            json={
-                "collection": str(collection_uuid),
-                "data": product_data
-            }
+        response = await client.post(
+            "/record",
+            content=orjson.dumps(
+                {"collection": collection_uuid, "data": product_data}, default=str
+            ),
         )
         
         if response.status_code == 200:
-            record_data = response.json()
+            record_data = orjson.loads(response.content)
             record_uuid = record_data["record_uuid"]
             print(f"\nProduct saved with record UUID: {record_uuid}")
         else:
-            print(f"\nFailed to save product: {response.json()}")
+            print(f"\nFailed to save product: {orjson.loads(response.content)}")
             return
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"\nFailed to save product: {e}")
         return
-    
-    # Query for the product
+
+    # Submit several products in a single request instead of one round trip each
+    products = [
+        Product.create_from_semantic(
+            name=f"Accessory {i}",
+            price=9.99 + i,
+            description=f"Accessory number {i} for the smartphone",
+            in_stock=i % 2 == 0
+        )
+        for i in range(5)
+    ]
+
     try:
-        # Create a filter with a UUID field
-        # For this example, we'll use a dummy filter
-        filter_uuid = list(product_data.keys())[0]  # First field UUID
-        filter_value = product_data[filter_uuid]
-        
-        response = requests.post(
-            f"{api_url}/query",
-            json={
-                "collection": str(collection_uuid),
-                "filter": {filter_uuid: filter_value},
-                "limit": 10,
-                "dev_mode": True  # Get semantic field names in response
-            }
+        response = await client.post(
+            "/records/bulk",
+            content=orjson.dumps(
+                {
+                    "collection": collection_uuid,
+                    "data": [p.model_dump(mode="json") for p in products],
+                },
+                default=str,
+            ),
         )
-        
+
         if response.status_code == 200:
-            query_result = response.json()
-            print("\nQuery results:")
-            print(json.dumps(query_result["results"], indent=2))
-            
-            if query_result["resolved_fields"]:
-                print("\nResolved fields (dev mode only):")
-                print(json.dumps(query_result["resolved_fields"], indent=2))
+            bulk_data = orjson.loads(response.content)
+            print(f"\nSaved {len(bulk_data['record_uuids'])} products in one request")
         else:
-            print(f"\nFailed to query products: {response.json()}")
+            print(f"\nFailed to save products: {orjson.loads(response.content)}")
             return
-    except requests.exceptions.RequestException as e:
-        print(f"\nFailed to query products: {e}")
+    except httpx.HTTPError as e:
+        print(f"\nFailed to save products: {e}")
         return
+
+    # Query for the product and fetch it by UUID concurrently; neither depends on the other
+    # For this example, we'll use a dummy filter on the first field
+    filter_uuid = list(product_data.keys())[0]
+    filter_value = product_data[filter_uuid]
     
-    # Get the product by UUID
     try:
-        response = requests.get(
-            f"{api_url}/record/{record_uuid}?collection={collection_uuid}&dev_mode=true"
+        query_response, record_response = await asyncio.gather(
+            client.post(
+                "/query",
+                content=orjson.dumps(
+                    {
+                        "collection": collection_uuid,
+                        "filter": {filter_uuid: filter_value},
+                        "limit": 10,
+                        "dev_mode": True  # Get semantic field names in response
+                    },
+                    default=str,
+                ),
+            ),
+            client.get(
+                f"/record/{record_uuid}",
+                params={"collection": str(collection_uuid), "dev_mode": "true"},
+            ),
         )
+    except httpx.HTTPError as e:
+        print(f"\nFailed to query products: {e}")
+        return
+    
+    if query_response.status_code == 200:
+        query_result = orjson.loads(query_response.content)
+        print("\nQuery results:")
+        print(pretty(query_result["results"]))
         
-        if response.status_code == 200:
-            record = response.json()
-            print("\nRetrieved product:")
-            print(json.dumps(record, indent=2))
-        else:
-            print(f"\nFailed to get product: {response.json()}")
-            return
-    except requests.exceptions.RequestException as e:
-        print(f"\nFailed to get product: {e}")
+        if query_result["resolved_fields"]:
+            print("\nResolved fields (dev mode only):")
+            print(pretty(query_result["resolved_fields"]))
+    else:
+        print(f"\nFailed to query products: {orjson.loads(query_response.content)}")
         return
+    
+    if record_response.status_code == 200:
+        record = orjson.loads(record_response.content)
+        print("\nRetrieved product:")
+        print(pretty(record))
+    else:
+        print(f"\nFailed to get product: {orjson.loads(record_response.content)}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -5,10 +5,11 @@ This example demonstrates how to define and use models with encrypted fields.
 """
 
 import os
-import json
+import sys
 from typing import List, Optional
 from uuid import UUID
 
+import orjson
 from pydantic import Field
 
 from indaleko_dbfacade.config import DBFacadeConfig
@@ -40,6 +41,25 @@ class UserWithEncryption(ObfuscatedModel):
     public_profile: bool = ObfuscatedField(obfuscation_level=ObfuscationLevel.NONE)
 
 
+def summarize_field(value: object) -> object:
+    """
+    Replace an encrypted field value with a short summary for display.
+    
+    Args:
+        value: The field value from the model dump
+        
+    Returns:
+        A summary of the encryption metadata, or the value unchanged
+    """
+    if isinstance(value, dict) and "metadata" in value:
+        return {
+            "value": "<encrypted value>",
+            "algorithm": value["metadata"]["algorithm"],
+            "created": value["metadata"]["created_at"],
+        }
+    return value
+
+
 def main() -> None:
     """Example usage of encrypted fields in obfuscated models."""
     # Setup environment for the example
@@ -65,26 +85,23 @@ def main() -> None:
     
     # In development mode, we can see the semantic field names and decrypted values
     print("\nUser model in DEV mode (decrypted for development):")
-    print(json.dumps(user.model_dump(), indent=2))
+    print(user.model_dump_json(indent=2))
     
     # Switch to production mode
     os.environ["INDALEKO_MODE"] = "PROD"
     DBFacadeConfig.initialize()
     
     # In production mode, we'll see UUID keys and encrypted values
-    print("\nUser model in PROD mode (encrypted sensitive fields):")
-    
-    # Get the raw data representation
     raw_data = user.model_dump()
+    display = {key: summarize_field(value) for key, value in raw_data.items()}
     
-    # Pretty-print with some formatting for clarity
-    for key, value in raw_data.items():
-        if isinstance(value, dict) and "metadata" in value:
-            print(f"{key}: <encrypted value>")
-            print(f"  Algorithm: {value['metadata']['algorithm']}")
-            print(f"  Created: {value['metadata']['created_at']}")
-        else:
-            print(f"{key}: {value}")
+    # Emit the heading and the whole summary with a single write
+    sys.stdout.write(
+        "\nUser model in PROD mode (encrypted sensitive fields):\n"
+        + orjson.dumps(display, option=orjson.OPT_INDENT_2, default=str).decode()
+        + "\n"
+    )
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -64,7 +64,7 @@ def main() -> None:
     
     # In development mode, we can see the semantic field names
     print("\nUser model in DEV mode:")
-    print(user.model_dump())
+    print(user.model_dump_json(indent=2))
     
     # Switch to production mode
     os.environ["INDALEKO_MODE"] = "PROD"
@@ -72,7 +72,7 @@ def main() -> None:
     
     # In production mode, we'll see UUID keys
     print("\nUser model in PROD mode:")
-    print(user.model_dump())
+    print(user.model_dump_json(indent=2))
     
     # Register the model schema (creates UUID mappings for all fields)
     mapping = User._register_model_schema()
@@ -6,16 +6,17 @@ This script starts the DB Facade Service API server or demonstrates
 the DB Facade Service in action based on command line arguments.
 """
 
-import argparse
 import os
 import sys
 import uuid
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+from indaleko_dbfacade.cli import bootstrap
 from indaleko_dbfacade.config import DBFacadeConfig
 from indaleko_dbfacade.service import start_api
 from indaleko_dbfacade.db_facade_service import DBFacadeService
+from indaleko_dbfacade.exceptions import DBFacadeError
 from indaleko_dbfacade.models.obfuscated_model import ObfuscatedModel
 from pydantic import BaseModel, Field
 
@@ -42,68 +43,6 @@ class ActivityRecord(ObfuscatedModel):
     details: Dict[str, Any] = Field(default_factory=dict)
 
 
-def parse_args() -> argparse.Namespace:
-    """
-    Parse command line arguments.
-    
-    Returns:
-        Parsed arguments
-    """
-    parser = argparse.ArgumentParser(description="DB Facade Service")
-    
-    # API server options
-    parser.add_argument(
-        "--host", 
-        default="0.0.0.0", 
-        help="Host to bind to (default: 0.0.0.0)"
-    )
-    
-    parser.add_argument(
-        "--port", 
-        type=int, 
-        default=8000, 
-        help="Port to bind to (default: 8000)"
-    )
-    
-    parser.add_argument(
-        "--config", 
-        help="Path to configuration file"
-    )
-    
-    parser.add_argument(
-        "--mode", 
-        choices=["DEV", "PROD"], 
-        help="Override operation mode (DEV or PROD)"
-    )
-    
-    parser.add_argument(
-        "--reload", 
-        action="store_true", 
-        help="Enable auto-reload for development"
-    )
-    
-    # Demo options
-    parser.add_argument(
-        "--demo",
-        action="store_true",
-        help="Run a demonstration of the DB Facade Service"
-    )
-    
-    parser.add_argument(
-        "--demo-create",
-        action="store_true",
-        help="Create example records in the database"
-    )
-    
-    parser.add_argument(
-        "--demo-query",
-        action="store_true",
-        help="Query example records from the database"
-    )
-    
-    return parser.parse_args()
-
-
 def run_demo_create() -> None:
     """Run a demonstration of creating records with the DB Facade Service."""
     print("Running DB Facade Service creation demo...")
@@ -150,7 +89,8 @@ def run_demo_query() -> None:
         users = service.query_models(
             UserProfile,
             {"username": "jdoe"},
-            limit=10
+            limit=10,
+            validate=False
         )
         
         print(f"Found {len(users)} user profiles:")
@@ -169,7 +109,8 @@ def run_demo_query() -> None:
                 activities = service.query_models(
                     ActivityRecord,
                     {"user_id": user_id},
-                    limit=5
+                    limit=5,
+                    validate=False
                 )
                 
                 print(f"  Recent Activities ({len(activities)}):")
@@ -179,9 +120,10 @@ def run_demo_query() -> None:
                     print(f"      Resource: {activity.resource}")
                     print(f"      Timestamp: {activity.timestamp}")
                     print(f"      Details: {activity.details}")
-            except Exception as e:
+            except (ConnectionError, TimeoutError, DBFacadeError) as e:
                 print(f"  Error querying activities: {e}")
-    except Exception as e:
+    except (ConnectionError, TimeoutError, DBFacadeError) as e:
+        # Anything else is unexpected and propagates with its traceback
         print(f"Error querying users: {e}")
     
     print("Query demo completed!")
@@ -189,23 +131,9 @@ def run_demo_query() -> None:
 
 def main() -> None:
     """Main entry point for the DB Facade Service."""
-    args = parse_args()
-    
-    # Set environment variables from command line
-    if args.mode:
-        os.environ["INDALEKO_MODE"] = args.mode
-    
-    # Initialize configuration
-    DBFacadeConfig.initialize()
-    
-    # Load config file if provided
-    if args.config:
-        DBFacadeConfig._load_from_file(args.config)
-    
     # Look for secrets file in standard location
     secrets_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".secrets", "db_config.yaml")
-    if os.path.exists(secrets_file):
-        DBFacadeConfig.load_from_secrets_file(secrets_file)
+    args = bootstrap(secrets_path=secrets_file)
     
     # Print startup information
     mode = DBFacadeConfig.get("mode")
@@ -226,7 +154,7 @@ def main() -> None:
     print(f"Starting API server on {args.host}:{args.port}")
     
     try:
-        start_api(host=args.host, port=args.port, reload=args.reload)
+        start_api(host=args.host, port=args.port, reload=args.reload, workers=args.workers)
     except KeyboardInterrupt:
         print("Service stopped")
         sys.exit(0)
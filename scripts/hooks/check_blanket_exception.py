@@ -8,67 +8,66 @@ discouraged in favor of more specific exception handling.
 
 import argparse
 import ast
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import List, Optional, Set, Tuple
 
+# Below this many files, checking serially is cheaper than starting worker processes
+PARALLEL_THRESHOLD = 4
 
-class BlanketExceptionVisitor(ast.NodeVisitor):
-    """AST visitor to find blanket exception handlers."""
 
-    def __init__(self) -> None:
-        self.blanket_exceptions: List[Tuple[int, str]] = []
+def find_blanket_exceptions(tree: ast.AST) -> List[Tuple[int, str]]:
+    """Find blanket exception handlers with a single walk over the tree."""
+    blanket_exceptions: List[Tuple[int, str]] = []
+    except_handler, name, tuple_ = ast.ExceptHandler, ast.Name, ast.Tuple
+
+    for node in ast.walk(tree):
+        if not isinstance(node, except_handler):
+            continue
 
-    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
-        """Visit exception handler nodes and check for blanket exceptions."""
         # Check for bare except: clause
         if node.type is None:
-            self.blanket_exceptions.append(
+            blanket_exceptions.append(
                 (node.lineno, "Bare except clause found. Use specific exceptions instead.")
             )
         # Check for except Exception: clause
-        elif isinstance(node.type, ast.Name) and node.type.id == "Exception":
-            self.blanket_exceptions.append(
+        elif isinstance(node.type, name) and node.type.id == "Exception":
+            blanket_exceptions.append(
                 (
                     node.lineno,
                     "Blanket 'except Exception:' found. Use specific exceptions instead.",
                 )
             )
         # Check for except (Exception): clause
-        elif isinstance(node.type, ast.Tuple):
-            exception_names = []
-            for elt in node.type.elts:
-                if isinstance(elt, ast.Name):
-                    exception_names.append(elt.id)
+        elif isinstance(node.type, tuple_):
+            exception_names = [elt.id for elt in node.type.elts if isinstance(elt, name)]
 
             if "Exception" in exception_names or "BaseException" in exception_names:
-                self.blanket_exceptions.append(
+                blanket_exceptions.append(
                     (
                         node.lineno,
                         f"Exception tuple contains too-generic exceptions: {', '.join(exception_names)}",
                     )
                 )
 
-        # Continue visiting children
-        self.generic_visit(node)
-
-    def check_exit_calls(self, node: ast.Expr) -> None:
-        """Check if the exception handler has sys.exit() calls to enforce fail-stop."""
-        # Implementation would check if there's a sys.exit() call
-        # This is a simplified version
-        pass
+    # ast.walk is breadth-first; report in source order
+    return sorted(blanket_exceptions, key=lambda issue: issue[0])
 
 
 def check_file(filename: str) -> List[Tuple[int, str]]:
     """Check a file for blanket exception handlers."""
-    with open(filename, "r", encoding="utf-8") as file:
-        content = file.read()
+    data = Path(filename).read_bytes()
+
+    # Files without an except clause cannot contain a blanket handler
+    if b"except" not in data:
+        return []
 
     try:
-        tree = ast.parse(content)
-        visitor = BlanketExceptionVisitor()
-        visitor.visit(tree)
-        return visitor.blanket_exceptions
+        tree = ast.parse(data.decode("utf-8"), filename, type_comments=False)
+        return find_blanket_exceptions(tree)
     except SyntaxError as e:
         return [(e.lineno or 0, f"SyntaxError: {str(e)}")]
 
@@ -79,12 +78,19 @@ def main() -> int:
     parser.add_argument("filenames", nargs="*", help="Filenames to check")
     args = parser.parse_args()
 
-    exit_code = 0
-    for filename in args.filenames:
-        if not filename.endswith(".py"):
-            continue
+    filenames = [f for f in args.filenames if f.endswith(".py")]
+    if not filenames:
+        return 0
 
-        issues = check_file(filename)
+    # Files are independent, so check them in parallel unless forking costs more than it saves
+    if len(filenames) < PARALLEL_THRESHOLD:
+        results = [check_file(filename) for filename in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(check_file, filenames, chunksize=8))
+
+    exit_code = 0
+    for filename, issues in zip(filenames, results, strict=True):
         for line, message in issues:
             print(f"{filename}:{line}: {message}")
             exit_code = 1
@@ -8,11 +8,20 @@ in database operations, logging, or error messages.
 
 import argparse
 import ast
+import bisect
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+# Hyperscan is optional; without it the hook uses the compiled regexes below
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 
 # Regular expression patterns for risky patterns
 DIRECT_DB_PATTERNS = [
@@ -29,6 +38,92 @@ DEV_MODE_PATTERNS = [
     r"if\s+(?:not\s+)?(?:os\.getenv\([\"']INDALEKO_MODE[\"']\)|DEV_MODE)\s*(?:==|!=)\s*[\"'](?:DEV|PROD)[\"']",  # Environment checks
 ]
 
+# Below this many files, checking serially is cheaper than starting worker processes
+PARALLEL_THRESHOLD = 4
+
+
+def _union(patterns: List[str]) -> "re.Pattern[str]":
+    """Combine patterns into one regex with a named group per alternative."""
+    return re.compile("|".join(f"(?P<g{i}>{pattern})" for i, pattern in enumerate(patterns)))
+
+
+# Compiled once at import; each list is scanned with a single pass over the file
+_DB_RE = _union(DIRECT_DB_PATTERNS)
+_LOG_RE = _union(LOG_PATTERNS)
+
+
+def _scan(regex: "re.Pattern[str]", content: str) -> List[Tuple[int, str]]:
+    """
+    Scan the whole file once, returning (line number, captured name) per match.
+
+    Each source pattern has exactly one capture group, which directly follows
+    the named group wrapping that alternative.
+    """
+    found = []
+    for match in regex.finditer(content):
+        captured = match.group(regex.groupindex[match.lastgroup] + 1)
+        found.append((content.count("\n", 0, match.start()) + 1, captured))
+    return found
+
+
+def _build_hyperscan_db() -> Optional["hyperscan.Database"]:
+    """Compile all DB and log patterns into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+
+    expressions = [pattern.encode("utf-8") for pattern in DIRECT_DB_PATTERNS + LOG_PATTERNS]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions),
+    )
+    return database
+
+
+_HS_DB = _build_hyperscan_db()
+
+# Hyperscan reports offsets only, so captures are re-read with the byte pattern at the match start
+_BYTE_PATTERNS = [
+    re.compile(pattern.encode("utf-8")) for pattern in DIRECT_DB_PATTERNS + LOG_PATTERNS
+]
+
+
+def _scan_hyperscan(content: str) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+    """
+    Scan the file once with Hyperscan for all DB and log patterns together.
+
+    Returns:
+        Tuple of (DB matches, log matches), each a list of (line number, captured name)
+    """
+    data = content.encode("utf-8")
+    line_starts = [0] + [match.end() for match in re.finditer(b"\n", data)]
+    starts: Set[Tuple[int, int]] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        # With SOM_LEFTMOST every end offset of a match repeats the same start
+        starts.add((pattern_id, start))
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+
+    db_found: List[Tuple[int, str]] = []
+    log_found: List[Tuple[int, str]] = []
+    for pattern_id, start in sorted(starts, key=lambda item: item[1]):
+        match = _BYTE_PATTERNS[pattern_id].match(data, start)
+        if match is None:
+            continue
+        found = db_found if pattern_id < len(DIRECT_DB_PATTERNS) else log_found
+        found.append((bisect.bisect_right(line_starts, start), match.group(1).decode("utf-8")))
+    return db_found, log_found
+
+
+def _find_matches(content: str) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+    """Find DB and log pattern matches, using Hyperscan when it is installed."""
+    if _HS_DB is not None:
+        return _scan_hyperscan(content)
+    return _scan(_DB_RE, content), _scan(_LOG_RE, content)
+
 
 class SemanticLeakageVisitor(ast.NodeVisitor):
     """AST visitor to find potential semantic data leakage."""
@@ -82,8 +177,7 @@ class SemanticLeakageVisitor(ast.NodeVisitor):
 
 def check_file(filename: str) -> List[Tuple[int, str]]:
     """Check a file for potential semantic data leakage."""
-    with open(filename, "r", encoding="utf-8") as file:
-        content = file.read()
+    content = Path(filename).read_bytes().decode("utf-8")
     
     issues = []
     
@@ -97,22 +191,20 @@ def check_file(filename: str) -> List[Tuple[int, str]]:
         issues.append((e.lineno or 0, f"SyntaxError: {str(e)}"))
     
     # Additional regex-based checks
-    lines = content.split('\n')
-    for i, line in enumerate(lines, 1):
-        # Check for direct database field access
-        for pattern in DIRECT_DB_PATTERNS:
-            matches = re.search(pattern, line)
-            if matches:
-                field = matches.group(1)
-                if not field.startswith('_'):  # Skip internal fields
-                    issues.append((i, f"Potential semantic leakage: direct field name '{field}' in database operation"))
-        
-        # Check for logging of sensitive data
-        for pattern in LOG_PATTERNS:
-            matches = re.search(pattern, line)
-            if matches:
-                var = matches.group(1)
-                issues.append((i, f"Potential semantic leakage: direct object attribute from '{var}' in log message"))
+    regex_issues = []
+    db_matches, log_matches = _find_matches(content)
+    
+    # Check for direct database field access
+    for line, field in db_matches:
+        if not field.startswith('_'):  # Skip internal fields
+            regex_issues.append((line, f"Potential semantic leakage: direct field name '{field}' in database operation"))
+    
+    # Check for logging of sensitive data
+    for line, var in log_matches:
+        regex_issues.append((line, f"Potential semantic leakage: direct object attribute from '{var}' in log message"))
+    
+    # Keep line order so database findings win over log findings on the same line
+    issues.extend(sorted(regex_issues, key=lambda issue: issue[0]))
     
     # De-duplicate issues by line
     unique_issues = {}
@@ -129,16 +221,23 @@ def main() -> int:
     parser.add_argument("filenames", nargs="*", help="Filenames to check")
     args = parser.parse_args()
     
+    filenames = [f for f in args.filenames if f.endswith(".py")]
+    if not filenames:
+        return 0
+
+    # Files are independent, so check them in parallel unless forking costs more than it saves
+    if len(filenames) < PARALLEL_THRESHOLD:
+        results = [check_file(filename) for filename in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(check_file, filenames, chunksize=8))
+
     exit_code = 0
-    for filename in args.filenames:
-        if not filename.endswith(".py"):
-            continue
-            
-        issues = check_file(filename)
+    for filename, issues in zip(filenames, results, strict=True):
         for line, message in issues:
             print(f"{filename}:{line}: {message}")
             exit_code = 1
-    
+
     return exit_code
 
 
@@ -5,20 +5,69 @@ This package provides tools for obfuscating database fields and models,
 mapping between semantic names and UUIDs to protect sensitive data.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .config import DBFacadeConfig
-from .models import ObfuscatedModel, ObfuscatedField
-from .encryption import FieldEncryptor, EncryptionMetadata, EncryptionAlgorithm
-from .service import app, start_api
+from .exceptions import DBFacadeError
+
+if TYPE_CHECKING:
+    from .encryption import EncryptionAlgorithm, EncryptionMetadata, FieldEncryptor, KeyDerivation
+    from .models import ObfuscatedField, ObfuscatedModel
+    from .service import app, start_api
 
 __version__ = "0.1.0"
 
 __all__ = [
     "DBFacadeConfig", 
+    "DBFacadeError",
     "ObfuscatedModel", 
     "ObfuscatedField",
     "FieldEncryptor", 
     "EncryptionMetadata", 
     "EncryptionAlgorithm",
+    "KeyDerivation",
     "app",
     "start_api"
-]
\ No newline at end of file
+]
+
+# Exports loaded on first access (PEP 562), so importing the package does not
+# pull in cryptography or FastAPI until they are actually used
+_LAZY_EXPORTS = {
+    "ObfuscatedModel": ".models",
+    "ObfuscatedField": ".models",
+    "FieldEncryptor": ".encryption",
+    "EncryptionMetadata": ".encryption",
+    "EncryptionAlgorithm": ".encryption",
+    "KeyDerivation": ".encryption",
+    "app": ".service",
+    "start_api": ".service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a lazily exported name on first access.
+    
+    Args:
+        name: The attribute being looked up
+        
+    Returns:
+        The exported object
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes, including lazy exports.
+    
+    Returns:
+        Sorted list of attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
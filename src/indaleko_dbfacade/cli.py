@@ -0,0 +1,111 @@
+"""
+Command line bootstrap for DB Facade.
+
+This module provides the shared argument parsing and configuration
+startup used by the DB Facade entry points.
+"""
+
+import argparse
+import os
+from collections.abc import Sequence
+
+from .config import DBFacadeConfig
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line argument parser.
+    
+    Returns:
+        The argument parser for the DB Facade Service
+    """
+    parser = argparse.ArgumentParser(description="DB Facade Service")
+    
+    # API server options
+    parser.add_argument(
+        "--host", 
+        default="0.0.0.0", 
+        help="Host to bind to (default: 0.0.0.0)"
+    )
+    
+    parser.add_argument(
+        "--port", 
+        type=int, 
+        default=8000, 
+        help="Port to bind to (default: 8000)"
+    )
+    
+    parser.add_argument(
+        "--config", 
+        help="Path to configuration file"
+    )
+    
+    parser.add_argument(
+        "--mode", 
+        choices=["DEV", "PROD"], 
+        help="Override operation mode (DEV or PROD)"
+    )
+    
+    parser.add_argument(
+        "--reload", 
+        action="store_true", 
+        help="Enable auto-reload for development"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of API worker processes (default: $WEB_CONCURRENCY or 1)"
+    )
+    
+    # Demo options
+    parser.add_argument(
+        "--demo",
+        action="store_true",
+        help="Run a demonstration of the DB Facade Service"
+    )
+    
+    parser.add_argument(
+        "--demo-create",
+        action="store_true",
+        help="Create example records in the database"
+    )
+    
+    parser.add_argument(
+        "--demo-query",
+        action="store_true",
+        help="Query example records from the database"
+    )
+    
+    return parser
+
+
+def bootstrap(
+    argv: Sequence[str] | None = None,
+    secrets_path: str | None = None,
+) -> argparse.Namespace:
+    """
+    Parse command line arguments and initialize the configuration.
+    
+    The configuration file and secrets file are each read once, in a single
+    DBFacadeConfig.initialize call.
+    
+    Args:
+        argv: Arguments to parse, defaulting to sys.argv
+        secrets_path: Optional secrets file, loaded only if it exists
+        
+    Returns:
+        Parsed arguments
+    """
+    args = build_parser().parse_args(argv)
+    
+    # Set environment variables from command line
+    if args.mode:
+        os.environ["INDALEKO_MODE"] = args.mode
+    
+    # Load every configuration source in one pass
+    if secrets_path is not None and not os.path.exists(secrets_path):
+        secrets_path = None
+    DBFacadeConfig.initialize(config_path=args.config, secrets_path=secrets_path)
+    
+    return args
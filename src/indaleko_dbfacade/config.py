@@ -6,14 +6,100 @@ of the DB Facade service, including development/production modes and
 encryption settings.
 """
 
+import functools
 import os
 import sys
+import tempfile
 from pathlib import Path
 from copy import deepcopy
 # No need for typing imports in Python 3.13
 
+import orjson
 import yaml
 
+# LibYAML-backed loader when PyYAML was built with it; same semantics, parsed in C
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Environment variables that override configuration values
+ENV_VARS = (
+    "INDALEKO_MODE",
+    "INDALEKO_ENCRYPTION_ENABLED",
+    "INDALEKO_DB_URL",
+    "INDALEKO_DB_USERNAME",
+    "INDALEKO_DB_PASSWORD",
+    "INDALEKO_REGISTRY_URL",
+)
+
+# Marks a key that is absent from the configuration, as distinct from a None value
+_MISSING = object()
+
+
+def _sidecar_path(path: str) -> Path:
+    """
+    Get the JSON cache file kept next to a YAML configuration file.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Path of the JSON sidecar
+    """
+    return Path(path + ".json")
+
+
+def _read_sidecar(path: str, mtime_ns: int, size: int) -> object:
+    """
+    Read the JSON sidecar for a YAML file if it was built from this version.
+    
+    Args:
+        path: Path to the YAML file
+        mtime_ns: Modification time of the YAML file
+        size: Size of the YAML file
+        
+    Returns:
+        The cached document, or _MISSING if there is no matching sidecar
+    """
+    try:
+        cached = orjson.loads(_sidecar_path(path).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return _MISSING
+    
+    if not isinstance(cached, dict) or cached.get("source") != {"mtime_ns": mtime_ns, "size": size}:
+        return _MISSING
+    return cached.get("data")
+
+
+def _write_sidecar(path: str, mtime_ns: int, size: int, data: object) -> None:
+    """
+    Write the JSON sidecar for a YAML file, if its data survives a JSON round trip.
+    
+    The sidecar is only an optimization, so a read-only directory simply
+    means the YAML is parsed again next time.
+    
+    Args:
+        path: Path to the YAML file
+        mtime_ns: Modification time of the YAML file
+        size: Size of the YAML file
+        data: The parsed YAML document
+    """
+    try:
+        payload = orjson.dumps({"source": {"mtime_ns": mtime_ns, "size": size}, "data": data})
+    except TypeError:
+        return
+    
+    # YAML-only types (dates, non-string keys) would come back changed
+    if orjson.loads(payload)["data"] != data:
+        return
+    
+    sidecar = _sidecar_path(path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        return
+
 
 class DBFacadeConfig:
     """
@@ -23,25 +109,39 @@ class DBFacadeConfig:
     environment-specific behaviors and encryption settings.
     """
     
-    # Default configuration values
-    _default_config: dict[str, object] = {
-        "mode": "DEV",  # DEV or PROD
-        "encryption": {
-            "enabled": False,
-            "algorithm": "AES-GCM",
-            "key_derivation": "PBKDF2",
-        },
-        "registry": {
-            "url": "http://localhost:8000",
-            "cache_ttl": 3600,  # seconds
-        },
-        "database": {
-            "url": "http://localhost:8529",
-            "database": "dbfacade",
-            "username": "root",
-            "password": "",
-        },
-    }
+    @staticmethod
+    def _fresh_default() -> dict[str, object]:
+        """
+        Build a new copy of the default configuration.
+        
+        Written as literals so initialize() gets independent nested dicts
+        without the cost of deepcopy.
+        
+        Returns:
+            The default configuration values
+        """
+        return {
+            "mode": "DEV",  # DEV or PROD
+            "encryption": {
+                "enabled": False,
+                "algorithm": "AES-GCM",
+                "key_derivation": "PBKDF2",  # or HKDF when the master key is random
+            },
+            "registry": {
+                "url": "http://localhost:8000",
+                "cache_ttl": 3600,  # seconds
+            },
+            "database": {
+                "url": "http://localhost:8529",
+                "database": "dbfacade",
+                "username": "root",
+                "password": "",
+                "pool_size": 40,  # pooled HTTP connections, one per API worker thread
+            },
+        }
+    
+    # Default configuration values, for reference; initialize() uses _fresh_default()
+    _default_config: dict[str, object] = _fresh_default()
     
     # Instance configuration values, loaded from file or environment
     _config: dict[str, object] = {}
@@ -49,26 +149,94 @@ class DBFacadeConfig:
     # Flag indicating if the configuration has been initialized
     _initialized: bool = False
     
+    # Bumped whenever the configuration changes, invalidating cached lookups
+    _config_version: int = 0
+    
+    # Snapshot of ENV_VARS taken by refresh_env()
+    _env: dict[str, str | None] = {}
+    
+    # Resolved get() lookups, keyed by dotted key and tagged with the config version
+    _get_cache: dict[str, tuple[int, object]] = {}
+    
+    # (config version, development mode, encryption enabled); the version never
+    # matches before initialization, so the first check resolves the flags
+    _mode_flags: tuple[int, bool, bool] = (-1, False, False)
+    
     @classmethod
-    def initialize(cls, config_path: str | None = None) -> None:
+    def initialize(cls, config_path: str | None = None, secrets_path: str | None = None) -> None:
         """
         Initialize the configuration.
         
+        Each source is read once, in order of increasing precedence: defaults,
+        the configuration file, the secrets file, then environment variables.
+        
         Args:
             config_path: Optional path to a YAML configuration file
+            secrets_path: Optional path to a YAML secrets file
         """
-        # Start with default configuration (deep copy to avoid shared nested dictionaries)
-        cls._config = deepcopy(cls._default_config)
+        # Start with a fresh default configuration, so nested dictionaries are never shared
+        cls._config = cls._fresh_default()
         
         # Load configuration from file if provided
         if config_path:
             cls._load_from_file(config_path)
         
-        # Override with environment variables
+        # Merge secrets if provided
+        if secrets_path:
+            cls._load_secrets(secrets_path)
+        
+        # Override with environment variables, as they are now
+        cls.refresh_env()
         cls._load_from_env()
         
         # Mark as initialized
         cls._initialized = True
+        cls._config_version += 1
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_yaml(path: str, mtime_ns: int, size: int, use_sidecar: bool = False) -> object:
+        """
+        Parse a YAML file with the safe loader, once per version.
+        
+        Args:
+            path: Path to the YAML file
+            mtime_ns: Modification time of the file, so edits invalidate the cache
+            size: Size of the file, catching edits within the mtime granularity
+            use_sidecar: Read and maintain a JSON copy of the file between runs
+            
+        Returns:
+            The parsed document, shared between callers and never mutated
+        """
+        if use_sidecar:
+            cached = _read_sidecar(path, mtime_ns, size)
+            if cached is not _MISSING:
+                return cached
+        
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=YAML_LOADER)
+        
+        if use_sidecar:
+            _write_sidecar(path, mtime_ns, size, data)
+        return data
+    
+    @classmethod
+    def _read_yaml(cls, path: Path, use_sidecar: bool = False) -> object:
+        """
+        Read a YAML file, reusing the parsed result while the file is unchanged.
+        
+        Args:
+            path: Path to the YAML file
+            use_sidecar: Read and maintain a JSON copy of the file between runs
+            
+        Returns:
+            A private copy of the parsed document, safe to merge into the config
+        """
+        resolved = path.resolve()
+        stat = resolved.stat()
+        return deepcopy(
+            cls._parse_yaml(str(resolved), stat.st_mtime_ns, stat.st_size, use_sidecar)
+        )
     
     @classmethod
     def _load_from_file(cls, config_path: str) -> None:
@@ -84,48 +252,61 @@ class DBFacadeConfig:
             sys.exit(1)
         
         try:
-            with open(path, "r") as f:
-                file_config = yaml.safe_load(f)
+            # Reuse the JSON sidecar from an earlier run while the file is unchanged
+            file_config = cls._read_yaml(path, use_sidecar=True)
                 
             # Update configuration with values from file
             if file_config:
                 cls._config.update(file_config)
+                cls._config_version += 1
         except Exception as e:
             print(f"Error loading configuration file: {e}")
             sys.exit(1)
     
+    @classmethod
+    def refresh_env(cls) -> None:
+        """
+        Re-read the environment variables the configuration depends on.
+        
+        The snapshot is taken in one pass over ENV_VARS. initialize() calls
+        this, so re-initializing always picks up the current environment.
+        """
+        cls._env = {name: os.environ.get(name) for name in ENV_VARS}
+    
     @classmethod
     def _load_from_env(cls) -> None:
-        """Load configuration from environment variables."""
+        """Load configuration from the environment variable snapshot."""
+        env = cls._env
+        
         # Check for mode override
-        env_mode = os.environ.get("INDALEKO_MODE")
+        env_mode = env.get("INDALEKO_MODE")
         if env_mode in ("DEV", "PROD"):
             cls._config["mode"] = env_mode
         
         # Check for encryption enabled override
-        env_encryption = os.environ.get("INDALEKO_ENCRYPTION_ENABLED")
+        env_encryption = env.get("INDALEKO_ENCRYPTION_ENABLED")
         if env_encryption in ("1", "true", "True", "yes", "Yes"):
             cls._config["encryption"]["enabled"] = True
         elif env_encryption in ("0", "false", "False", "no", "No"):
             cls._config["encryption"]["enabled"] = False
         
         # Check for database URL override
-        env_db_url = os.environ.get("INDALEKO_DB_URL")
+        env_db_url = env.get("INDALEKO_DB_URL")
         if env_db_url:
             cls._config["database"]["url"] = env_db_url
         
         # Check for database username override
-        env_db_username = os.environ.get("INDALEKO_DB_USERNAME")
+        env_db_username = env.get("INDALEKO_DB_USERNAME")
         if env_db_username:
             cls._config["database"]["username"] = env_db_username
         
         # Check for database password override
-        env_db_password = os.environ.get("INDALEKO_DB_PASSWORD")
+        env_db_password = env.get("INDALEKO_DB_PASSWORD")
         if env_db_password:
             cls._config["database"]["password"] = env_db_password
         
         # Check for registry URL override
-        env_registry_url = os.environ.get("INDALEKO_REGISTRY_URL")
+        env_registry_url = env.get("INDALEKO_REGISTRY_URL")
         if env_registry_url:
             cls._config["registry"]["url"] = env_registry_url
     
@@ -135,6 +316,20 @@ class DBFacadeConfig:
         if not cls._initialized:
             cls.initialize()
     
+    @classmethod
+    def version(cls) -> int:
+        """
+        Get the current configuration version.
+        
+        The version changes whenever the configuration does, so callers can
+        tag objects built from the configuration and rebuild them when stale.
+        
+        Returns:
+            The configuration version
+        """
+        cls._ensure_initialized()
+        return cls._config_version
+    
     @classmethod
     def get(cls, key: str, default: object = None) -> object:
         """
@@ -149,6 +344,27 @@ class DBFacadeConfig:
         """
         cls._ensure_initialized()
         
+        # Reuse the lookup while the configuration is unchanged
+        cached = cls._get_cache.get(key)
+        if cached is not None and cached[0] == cls._config_version:
+            value = cached[1]
+        else:
+            value = cls._lookup(key)
+            cls._get_cache[key] = (cls._config_version, value)
+        
+        return default if value is _MISSING else value
+    
+    @classmethod
+    def _lookup(cls, key: str) -> object:
+        """
+        Resolve a configuration key against the current configuration.
+        
+        Args:
+            key: The configuration key, using dot notation for nested values
+            
+        Returns:
+            The configuration value, or _MISSING if not found
+        """
         # Support nested keys with dot notation
         if "." in key:
             parts = key.split(".")
@@ -157,10 +373,10 @@ class DBFacadeConfig:
                 if isinstance(value, dict) and part in value:
                     value = value[part]
                 else:
-                    return default
+                    return _MISSING
             return value
         
-        return cls._config.get(key, default)
+        return cls._config.get(key, _MISSING)
     
     @classmethod
     def is_dev_mode(cls) -> bool:
@@ -170,7 +386,10 @@ class DBFacadeConfig:
         Returns:
             True if in development mode, False otherwise
         """
-        return cls.get("mode") == "DEV"
+        flags = cls._mode_flags
+        if not cls._initialized or flags[0] != cls._config_version:
+            flags = cls._refresh_mode_flags()
+        return flags[1]
     
     @classmethod
     def is_encryption_enabled(cls) -> bool:
@@ -180,7 +399,29 @@ class DBFacadeConfig:
         Returns:
             True if encryption is enabled, False otherwise
         """
-        return cls.get("encryption.enabled", False)
+        flags = cls._mode_flags
+        if not cls._initialized or flags[0] != cls._config_version:
+            flags = cls._refresh_mode_flags()
+        return flags[2]
+    
+    @classmethod
+    def _refresh_mode_flags(cls) -> tuple[int, bool, bool]:
+        """
+        Resolve the development-mode and encryption flags for the current configuration.
+        
+        These flags are checked on every model dump, so they are computed once
+        per configuration version and then read with a single comparison. A
+        reset configuration is always re-initialized first, so flags from the
+        previous configuration are never reused.
+        
+        Returns:
+            Tuple of (configuration version, development mode, encryption enabled)
+        """
+        # get() initializes the configuration first if needed, which bumps the version
+        dev_mode = cls.get("mode") == "DEV"
+        encryption_enabled = bool(cls.get("encryption.enabled", False))
+        cls._mode_flags = (cls._config_version, dev_mode, encryption_enabled)
+        return cls._mode_flags
     
     @classmethod
     def get_registry_url(cls) -> str:
@@ -224,6 +465,16 @@ class DBFacadeConfig:
         This is a convenience method for loading configuration from
         a secrets file, which can contain sensitive information.
         
+        Args:
+            file_path: Path to the secrets file
+        """
+        cls._load_secrets(file_path)
+    
+    @classmethod
+    def _load_secrets(cls, file_path: str) -> None:
+        """
+        Merge a secrets file into the configuration, section by section.
+        
         Args:
             file_path: Path to the secrets file
         """
@@ -233,8 +484,8 @@ class DBFacadeConfig:
             return
         
         try:
-            with open(path, "r") as f:
-                secrets = yaml.safe_load(f)
+            # No JSON sidecar here: secrets are never copied elsewhere on disk
+            secrets = cls._read_yaml(path)
                 
             # Update configuration with values from secrets
             if secrets:
@@ -245,8 +496,9 @@ class DBFacadeConfig:
                         cls._config[section].update(values)
                     else:
                         cls._config[section] = values
+                cls._config_version += 1
                 
             print(f"Loaded configuration from secrets file: {file_path}")
         except Exception as e:
             print(f"Error loading secrets file: {e}")
-            sys.exit(1)
\ No newline at end of file
+            sys.exit(1)
@@ -5,14 +5,19 @@ This module provides a client for connecting to ArangoDB using
 the python-arango driver, designed for the DB Facade service.
 """
 
+import hashlib
 import json
 import sys
+import threading
 import uuid
 from datetime import datetime, timezone
 from typing import cast
 
+import orjson
 from arango import ArangoClient
 from arango.cursor import Cursor
+from arango.database import StandardDatabase
+from arango.http import DefaultHTTPClient
 from arango.exceptions import (
     ArangoError,
     CollectionCreateError,
@@ -23,6 +28,38 @@ from arango.exceptions import (
 )
 
 from ..config import DBFacadeConfig
+from ..exceptions import DBFacadeDBError
+from ..uuid_pool import uuid4
+
+
+# Verified connections by (URL, database, username, password digest), shared by
+# all clients, and the number of open clients using each
+_CONNECTIONS: dict[tuple[str, str, str, str], tuple[ArangoClient, StandardDatabase]] = {}
+_CONNECTION_USERS: dict[tuple[str, str, str, str], int] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _serialize(obj: object) -> str:
+    """
+    Serialize a request body for the driver with orjson.
+    
+    Args:
+        obj: JSON-compatible object to serialize
+        
+    Returns:
+        The serialized JSON text
+    """
+    return orjson.dumps(obj).decode()
+
+
+def _now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 timestamp.
+    
+    Returns:
+        The timestamp stored in created_at/updated_at fields
+    """
+    return datetime.now(timezone.utc).isoformat()
 
 
 class ArangoDBClient:
@@ -31,6 +68,8 @@ class ArangoDBClient:
     
     This client interacts with ArangoDB using the python-arango driver,
     providing methods for CRUD operations on collections and documents.
+    Driver failures are raised as DBFacadeDBError so the caller decides
+    whether to retry or stop.
     """
     
     def __init__(
@@ -52,31 +91,79 @@ class ArangoDBClient:
         db_config = DBFacadeConfig.get_database_credentials()
         db_url = DBFacadeConfig.get_database_url()
         
-        try:
-            # Initialize ArangoDB client
-            self.client = ArangoClient(hosts=db_url)
-            
-            # Connect to the database
-            self.db = self.client.db(
-                name=db_config["database"],
-                username=db_config["username"],
-                password=db_config["password"],
-                auth_method="basic",
-                verify=True
-            )
-            
-            # Verify connection
-            self.db.properties()  # This will raise an exception if connection fails
+        # Reuse a connection already verified for the same server and
+        # credentials; the password is only kept as a digest
+        self._connection_key = (
+            db_url,
+            db_config["database"],
+            db_config["username"],
+            hashlib.sha256(db_config["password"].encode("utf-8")).hexdigest(),
+        )
+        self._closed = False
+        with _CONNECTIONS_LOCK:
+            connection = _CONNECTIONS.get(self._connection_key)
+            if connection is not None:
+                _CONNECTION_USERS[self._connection_key] += 1
+        if connection is not None:
+            self.client, self.db = connection
+        else:
+            try:
+                # Initialize ArangoDB client
+                # Keep enough pooled connections for every API worker thread
+                self.client = ArangoClient(
+                    hosts=db_url,
+                    http_client=DefaultHTTPClient(
+                        pool_maxsize=DBFacadeConfig.get("database.pool_size", 40)
+                    ),
+                    serializer=_serialize,
+                    deserializer=orjson.loads
+                )
+                
+                # Connect to the database
+                self.db = self.client.db(
+                    name=db_config["database"],
+                    username=db_config["username"],
+                    password=db_config["password"],
+                    auth_method="basic",
+                    verify=True
+                )
+                
+                # Verify connection
+                self.db.properties()  # This will raise an exception if connection fails
+                
+            except ArangoError as e:
+                raise DBFacadeDBError(f"Failed to connect to ArangoDB: {e}") from e
             
-        except ArangoError as e:
-            print(f"Failed to connect to ArangoDB: {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Unexpected error connecting to database: {e}", file=sys.stderr)
-            sys.exit(1)
+            self._share_connection()
+        
+        # Verify collections exist, releasing the connection reference taken
+        # above if they cannot be checked or created
+        try:
+            self._ensure_collections_exist()
+        except DBFacadeDBError:
+            self.close()
+            raise
+        
+        # Collection handle reused by every document operation
+        self._data = self.db.collection(self.data_collection)
+    
+    def _share_connection(self) -> None:
+        """
+        Register this client's new connection for reuse by later clients.
+        
+        If another thread registered a connection for the same key in the
+        meantime, that one is used instead and this client's is closed.
+        """
+        with _CONNECTIONS_LOCK:
+            existing = _CONNECTIONS.get(self._connection_key)
+            if existing is None:
+                _CONNECTIONS[self._connection_key] = (self.client, self.db)
+                _CONNECTION_USERS[self._connection_key] = 1
+                return
+            _CONNECTION_USERS[self._connection_key] += 1
         
-        # Verify collections exist
-        self._ensure_collections_exist()
+        self.client.close()
+        self.client, self.db = existing
     
     def _ensure_collections_exist(self) -> None:
         """
@@ -85,24 +172,21 @@ class ArangoDBClient:
         If the collections don't exist, they will be created.
         """
         try:
-            existing_collections = [col["name"] for col in self.db.collections()]
-            
-            # Create registry collection if it doesn't exist
-            if self.registry_collection not in existing_collections:
+            # Create registry collection if it doesn't exist (checks this one
+            # collection rather than listing every collection in the database)
+            if not self.db.has_collection(self.registry_collection):
                 print(f"Creating collection: {self.registry_collection}")
                 self.db.create_collection(self.registry_collection)
                 
             # Create data collection if it doesn't exist
-            if self.data_collection not in existing_collections:
+            if not self.db.has_collection(self.data_collection):
                 print(f"Creating collection: {self.data_collection}")
                 self.db.create_collection(self.data_collection)
                 
         except CollectionCreateError as e:
-            print(f"Failed to create collection: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Failed to create collection: {e}") from e
         except ArangoError as e:
-            print(f"Failed to list collections: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Failed to check collections: {e}") from e
     
     def insert(self, collection_uuid: uuid.UUID, data: dict[str, object]) -> uuid.UUID:
         """
@@ -116,29 +200,65 @@ class ArangoDBClient:
             UUID of the created document
         """
         # Generate a UUID for the document
-        doc_uuid = uuid.uuid4()
+        doc_uuid = uuid4()
         
         # Prepare the document for insertion
         document = {
             "_key": str(doc_uuid),
             "collection_uuid": str(collection_uuid),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": _now_iso(),
             "data": data
         }
         
         try:
             # Insert the document
-            collection = self.db.collection(self.data_collection)
-            collection.insert(document)
+            self._data.insert(document)
             return doc_uuid
             
         except DocumentInsertError as e:
-            print(f"Failed to insert document: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Failed to insert document: {e}") from e
         except ArangoError as e:
-            print(f"Database error during insert: {e}", file=sys.stderr)
-            sys.exit(1)
-    
+            raise DBFacadeDBError(f"Database error during insert: {e}") from e
+
+    def insert_many(
+        self, collection_uuid: uuid.UUID, records: list[dict[str, object]]
+    ) -> list[uuid.UUID]:
+        """
+        Insert several documents into the database in one request.
+
+        Args:
+            collection_uuid: UUID of the collection
+            records: List of document data, each with UUID keys
+
+        Returns:
+            UUIDs of the created documents, in the order of the records
+        """
+        # Generate a UUID for each document
+        doc_uuids = [uuid4() for _ in records]
+        created_at = _now_iso()
+
+        # Prepare the documents for insertion
+        documents = [
+            {
+                "_key": str(doc_uuid),
+                "collection_uuid": str(collection_uuid),
+                "created_at": created_at,
+                "data": data
+            }
+            for doc_uuid, data in zip(doc_uuids, records, strict=True)
+        ]
+
+        try:
+            # Insert all documents, failing on the first rejected one; the
+            # per-document results are only checked when not silent
+            self._data.insert_many(documents, raise_on_document_error=True)
+            return doc_uuids
+
+        except DocumentInsertError as e:
+            raise DBFacadeDBError(f"Failed to insert documents: {e}") from e
+        except ArangoError as e:
+            raise DBFacadeDBError(f"Database error during bulk insert: {e}") from e
+
     def query(
         self, 
         collection_uuid: uuid.UUID, 
@@ -156,49 +276,34 @@ class ArangoDBClient:
         Returns:
             List of matching documents
         """
-        # Prepare the filter conditions
-        filter_conditions = []
-        bind_vars = {
-            "collection_uuid": str(collection_uuid),
-            "limit": limit
-        }
-        
-        # Add filter conditions for each field
-        for i, (field_uuid, value) in enumerate(filter_dict.items()):
-            filter_conditions.append(f"doc.data['{field_uuid}'] == @value{i}")
-            bind_vars[f"value{i}"] = value
-        
-        # Combine filter conditions
-        filter_clause = " AND ".join(filter_conditions) if filter_conditions else "true"
-        
-        # Construct the AQL query
-        query = f"""
-        FOR doc IN {self.data_collection}
+        # The filter is a single bind parameter matched against the document
+        # data as a whole, so the query text is the same for every call
+        query = """
+        FOR doc IN @@collection
         FILTER doc.collection_uuid == @collection_uuid
-        AND {filter_clause}
+        AND MATCHES(doc.data, @filter)
         LIMIT @limit
-        RETURN doc
+        RETURN doc.data
         """
         
-        
         try:
             # Execute the query
             cursor = self.db.aql.execute(
                 query,
-                bind_vars=bind_vars,
+                bind_vars={
+                    "@collection": self.data_collection,
+                    "collection_uuid": str(collection_uuid),
+                    "filter": filter_dict,
+                    "limit": limit
+                },
                 batch_size=1000
             )
             
-            # Extract the data from each document
-            results = []
-            for doc in cursor:
-                results.append(doc["data"])
-            
-            return results
+            # The server already returns only the data of each document
+            return list(cursor)
             
         except ArangoError as e:
-            print(f"Query failed: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Query failed: {e}") from e
     
     def get(self, collection_uuid: uuid.UUID, record_uuid: uuid.UUID) -> dict[str, object]:
         """
@@ -211,13 +316,12 @@ class ArangoDBClient:
         Returns:
             Document data with UUID keys
         """
-        # Construct the AQL query
-        query = f"""
-        FOR doc IN {self.data_collection}
-        FILTER doc._key == @record_uuid
-        AND doc.collection_uuid == @collection_uuid
-        LIMIT 1
-        RETURN doc
+        # Fetch the document directly by key and return only its data, so
+        # the envelope fields never cross the network
+        query = """
+        LET doc = DOCUMENT(@collection, @key)
+        FILTER doc != null AND doc.collection_uuid == @collection_uuid
+        RETURN doc.data
         """
         
         try:
@@ -225,26 +329,27 @@ class ArangoDBClient:
             cursor = self.db.aql.execute(
                 query,
                 bind_vars={
-                    "record_uuid": str(record_uuid),
+                    "collection": self.data_collection,
+                    "key": str(record_uuid),
                     "collection_uuid": str(collection_uuid)
                 }
             )
             
-            # Get the result
-            results = list(cursor)
+            # Take the single row and release the cursor without draining it
+            data = next(cursor, None)
+            cursor.close(ignore_missing=True)
             
-            # Check if a document was found
-            if not results:
+            # Check if a document was found in the requested collection
+            if data is None:
                 raise ValueError(f"Document with UUID {record_uuid} not found")
                 
             # Return the document data
-            return results[0]["data"]
+            return data
             
         except ValueError:
             raise  # Re-raise ValueError as is
         except ArangoError as e:
-            print(f"Failed to get document: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Failed to get document: {e}") from e
     
     def update(
         self, 
@@ -263,23 +368,55 @@ class ArangoDBClient:
         # Prepare the update
         update_doc = {
             "data": data,
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "updated_at": _now_iso()
         }
         
         try:
             # Update the document
-            collection = self.db.collection(self.data_collection)
-            collection.update({
+            self._data.update({
                 "_key": str(record_uuid),
                 **update_doc
             })
             
         except DocumentUpdateError as e:
-            print(f"Failed to update document: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Failed to update document: {e}") from e
         except ArangoError as e:
-            print(f"Database error during update: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Database error during update: {e}") from e
+    
+    def update_many(
+        self,
+        collection_uuid: uuid.UUID,
+        updates: dict[uuid.UUID, dict[str, object]]
+    ) -> None:
+        """
+        Update several documents in the database in one request.
+        
+        Args:
+            collection_uuid: UUID of the collection
+            updates: Updated document data with UUID keys, by document UUID
+        """
+        updated_at = _now_iso()
+        
+        # Prepare the updates
+        documents = [
+            {
+                "_key": str(record_uuid),
+                "data": data,
+                "updated_at": updated_at
+            }
+            for record_uuid, data in updates.items()
+        ]
+        
+        try:
+            # Update all documents, failing on the first rejected one, such as
+            # a missing key; the per-document results are only checked when
+            # not silent
+            self._data.update_many(documents, raise_on_document_error=True)
+            
+        except DocumentUpdateError as e:
+            raise DBFacadeDBError(f"Failed to update documents: {e}") from e
+        except ArangoError as e:
+            raise DBFacadeDBError(f"Database error during bulk update: {e}") from e
     
     def delete(self, collection_uuid: uuid.UUID, record_uuid: uuid.UUID) -> None:
         """
@@ -291,20 +428,56 @@ class ArangoDBClient:
         """
         try:
             # Delete the document
-            collection = self.db.collection(self.data_collection)
-            collection.delete(str(record_uuid))
+            self._data.delete(str(record_uuid))
+            
+        except DocumentDeleteError as e:
+            raise DBFacadeDBError(f"Failed to delete document: {e}") from e
+        except ArangoError as e:
+            raise DBFacadeDBError(f"Database error during delete: {e}") from e
+    
+    def delete_many(
+        self, collection_uuid: uuid.UUID, record_uuids: list[uuid.UUID]
+    ) -> None:
+        """
+        Delete several documents from the database in one request.
+        
+        Args:
+            collection_uuid: UUID of the collection
+            record_uuids: UUIDs of the documents
+        """
+        try:
+            # Delete all documents, failing on the first rejected one, such as
+            # a missing key; the per-document results are only checked when
+            # not silent
+            self._data.delete_many(
+                [{"_key": str(record_uuid)} for record_uuid in record_uuids],
+                raise_on_document_error=True
+            )
             
         except DocumentDeleteError as e:
-            print(f"Failed to delete document: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Failed to delete documents: {e}") from e
         except ArangoError as e:
-            print(f"Database error during delete: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DBFacadeDBError(f"Database error during bulk delete: {e}") from e
     
     def close(self) -> None:
         """
         Close the database connection.
         """
+        if self._closed:
+            return
+        self._closed = True
+        
+        # The connection is shared, so it is only closed with its last client;
+        # later clients must not be handed the closed connection
+        with _CONNECTIONS_LOCK:
+            if _CONNECTIONS.get(self._connection_key, (None, None))[0] is self.client:
+                users = _CONNECTION_USERS[self._connection_key] - 1
+                if users:
+                    _CONNECTION_USERS[self._connection_key] = users
+                    return
+                del _CONNECTIONS[self._connection_key]
+                del _CONNECTION_USERS[self._connection_key]
+        
         try:
             self.client.close()
         except Exception as e:
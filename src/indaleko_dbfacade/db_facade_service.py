@@ -12,6 +12,7 @@ for obfuscated database operations with proper error handling following the fail
 
 import sys
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import TypeVar, cast
 
@@ -19,6 +20,7 @@ from pydantic import BaseModel
 
 from .config import DBFacadeConfig
 from .db.arangodb import ArangoDBClient
+from .exceptions import RecordNotFoundError
 from .registry.client import RegistryClient
 from .models.obfuscated_model import ObfuscatedModel
 
@@ -41,7 +43,8 @@ class DBFacadeService:
     def __init__(
         self,
         registry_collection: str = "dbfacade_registry",
-        data_collection: str = "dbfacade_data"
+        data_collection: str = "dbfacade_data",
+        db: ArangoDBClient | None = None
     ) -> None:
         """
         Initialize the DB Façade Service.
@@ -49,16 +52,20 @@ class DBFacadeService:
         Args:
             registry_collection: Name of the collection for registry data
             data_collection: Name of the collection for application data
+            db: Optional existing database client to share instead of creating one
         """
-        # Initialize database client
-        try:
-            self.db = ArangoDBClient(
-                registry_collection=registry_collection,
-                data_collection=data_collection
-            )
-        except Exception as e:
-            print(f"CRITICAL: Failed to initialize database connection: {e}", file=sys.stderr)
-            sys.exit(1)
+        # Initialize database client, unless the caller shares one
+        if db is not None:
+            self.db = db
+        else:
+            try:
+                self.db = ArangoDBClient(
+                    registry_collection=registry_collection,
+                    data_collection=data_collection
+                )
+            except Exception as e:
+                print(f"CRITICAL: Failed to initialize database connection: {e}", file=sys.stderr)
+                sys.exit(1)
         
         # Initialize registry client with the same registry collection
         try:
@@ -98,6 +105,44 @@ class DBFacadeService:
         
         return record_uuid
     
+    def store_models(self, models: list[ObfuscatedModel]) -> list[uuid.UUID]:
+        """
+        Store several obfuscated models in the database.
+        
+        Models are grouped by class and each group is inserted with a
+        single bulk request.
+        
+        Args:
+            models: The models to store
+            
+        Returns:
+            UUIDs of the stored records, in the order of the models
+            
+        Raises:
+            ValueError: If any model is invalid
+        """
+        if not all(isinstance(model, ObfuscatedModel) for model in models):
+            raise ValueError("Model must be an instance of ObfuscatedModel")
+        
+        # Group the models' positions by model class
+        groups: dict[type[ObfuscatedModel], list[int]] = {}
+        for index, model in enumerate(models):
+            groups.setdefault(model.__class__, []).append(index)
+        
+        record_uuids: list[uuid.UUID | None] = [None] * len(models)
+        for model_class, indexes in groups.items():
+            # Get the collection UUID for the model class
+            collection_uuid = self.registry.get_uuid_for_label(model_class.__name__)
+            
+            # Store the group's obfuscated data in one request
+            group_uuids = self.db.insert_many(
+                collection_uuid, [models[index].get_obfuscated_data() for index in indexes]
+            )
+            for index, record_uuid in zip(indexes, group_uuids, strict=True):
+                record_uuids[index] = record_uuid
+        
+        return cast(list[uuid.UUID], record_uuids)
+    
     def get_model(
         self, 
         model_class: type[T], 
@@ -138,15 +183,13 @@ class DBFacadeService:
             
             # Convert the data back to a model instance
             if use_dev_mode:
-                # In development mode, resolve UUIDs to semantic field names
-                resolved_data = {}
-                for field_uuid, value in data.items():
-                    try:
-                        field_name = self.registry.get_label_for_uuid(uuid.UUID(field_uuid))
-                        resolved_data[field_name] = value
-                    except (ValueError, KeyError):
-                        # If we can't resolve the UUID, use it as is
-                        resolved_data[field_uuid] = value
+                # In development mode, resolve UUIDs to semantic field names;
+                # unresolvable keys are used as is
+                field_names = self._field_names_for(model_class, data)
+                resolved_data = {
+                    field_names.get(field_uuid, field_uuid): value
+                    for field_uuid, value in data.items()
+                }
                 
                 return model_class.model_validate(resolved_data)
             else:
@@ -154,14 +197,15 @@ class DBFacadeService:
                 return model_class.from_obfuscated(data)
         except ValueError as e:
             # Re-raise with a more descriptive message
-            raise ValueError(f"Record not found: {e}")
+            raise RecordNotFoundError(f"Record not found: {e}") from e
     
     def query_models(
         self,
         model_class: type[T],
         filter_dict: dict[str, object],
         limit: int = 50,
-        dev_mode: bool | None = None
+        dev_mode: bool | None = None,
+        validate: bool = True
     ) -> list[T]:
         """
         Query models from the database.
@@ -174,6 +218,8 @@ class DBFacadeService:
             filter_dict: Filter criteria (can use semantic field names in dev mode)
             limit: Maximum number of results to return
             dev_mode: Override for development mode
+            validate: Whether to run full validation on each row; pass False to
+                build instances with model_construct for trusted data the facade wrote
             
         Returns:
             List of model instances
@@ -209,24 +255,35 @@ class DBFacadeService:
         # Query the database
         results = self.db.query(collection_uuid, obfuscated_filter, limit)
         
+        # In development mode, resolve the field UUIDs of all rows in one batch
+        if use_dev_mode:
+            field_names = self._field_names_for(
+                model_class, {key for data in results for key in data}
+            )
+            
+            # Same core validator model_validate calls, bound once instead of
+            # paying the classmethod wrapper on every row
+            validate_row = model_class.__pydantic_validator__.validate_python
+        
         # Convert the results to model instances
         models = []
         for data in results:
             if use_dev_mode:
-                # In development mode, resolve UUIDs to semantic field names
-                resolved_data = {}
-                for field_uuid, value in data.items():
-                    try:
-                        field_name = self.registry.get_label_for_uuid(uuid.UUID(field_uuid))
-                        resolved_data[field_name] = value
-                    except (ValueError, KeyError):
-                        # If we can't resolve the UUID, use it as is
-                        resolved_data[field_uuid] = value
+                # In development mode, resolve UUIDs to semantic field names;
+                # unresolvable keys are used as is
+                resolved_data = {
+                    field_names.get(field_uuid, field_uuid): value
+                    for field_uuid, value in data.items()
+                }
                 
-                models.append(model_class.model_validate(resolved_data))
+                if validate:
+                    models.append(validate_row(resolved_data))
+                else:
+                    # Trusted rows written by the facade skip re-validation
+                    models.append(model_class.model_construct(**resolved_data))
             else:
                 # In production mode, use the model's from_obfuscated method
-                models.append(model_class.from_obfuscated(data))
+                models.append(model_class.from_obfuscated(data, validate=validate))
         
         return models
     
@@ -291,23 +348,66 @@ class DBFacadeService:
         Returns:
             Dictionary mapping UUIDs to semantic names
         """
-        resolved_fields = {}
-        for field_uuid in data.keys():
+        return self._labels_for_keys(data)
+    
+    def _labels_for_keys(self, keys: Iterable[str]) -> dict[str, str]:
+        """
+        Resolve UUID-string keys to semantic names with one registry lookup.
+        
+        Args:
+            keys: Field keys, normally UUID strings
+            
+        Returns:
+            Dictionary mapping each resolvable key to its semantic name; keys
+            that are not UUIDs or not in the registry are left out
+        """
+        field_uuids = {}
+        for key in keys:
             try:
-                field_name = self.registry.get_label_for_uuid(uuid.UUID(field_uuid))
-                resolved_fields[field_uuid] = field_name
-            except (ValueError, KeyError):
-                # If we can't resolve the UUID, skip it
-                pass
+                field_uuids[key] = uuid.UUID(key)
+            except ValueError:
+                # Not a UUID, so there is nothing to resolve
+                continue
+        
+        labels = self.registry.get_labels_for_uuids(field_uuids.values())
+        return {
+            key: labels[field_uuid]
+            for key, field_uuid in field_uuids.items()
+            if field_uuid in labels
+        }
+    
+    def _field_names_for(
+        self, model_class: type[ObfuscatedModel], keys: Iterable[str]
+    ) -> dict[str, str]:
+        """
+        Resolve stored field keys to semantic names for a model class.
+        
+        A registered model's table answers its own fields without parsing or
+        a registry lookup; only keys outside it go to the registry.
         
-        return resolved_fields
+        Args:
+            model_class: The model class the keys belong to
+            keys: Field keys, normally UUID strings
+            
+        Returns:
+            Dictionary mapping each resolvable key to its semantic name
+        """
+        field_names = model_class._uuid_field_map
+        if field_names is None:
+            return self._labels_for_keys(keys)
+        
+        missing = [key for key in keys if key not in field_names]
+        if not missing:
+            return field_names
+        return {**field_names, **self._labels_for_keys(missing)}
     
     def register_model_schema(self, model_class: type[ObfuscatedModel]) -> dict[str, uuid.UUID]:
         """
         Register a model schema with the registry.
         
         This ensures that all fields in the model have UUIDs assigned
-        in the registry.
+        in the registry, and keeps the mapping on the model class so
+        development mode can resolve its fields without the registry.
         
         Args:
             model_class: The model class to register
@@ -315,4 +415,6 @@ class DBFacadeService:
         Returns:
             Dictionary mapping field names to their UUIDs
         """
-        return self.registry.register_model_schema(model_class)
+        mapping = self.registry.register_model_schema(model_class)
+        model_class._set_field_uuid_map(mapping)
+        return mapping
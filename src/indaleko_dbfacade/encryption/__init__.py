@@ -5,6 +5,6 @@ This module provides tools for encrypting and decrypting sensitive fields
 in database models.
 """
 
-from .field_encryptor import FieldEncryptor, EncryptionMetadata, EncryptionAlgorithm
+from .field_encryptor import FieldEncryptor, EncryptionMetadata, EncryptionAlgorithm, KeyDerivation
 
-__all__ = ["FieldEncryptor", "EncryptionMetadata", "EncryptionAlgorithm"]
\ No newline at end of file
+__all__ = ["FieldEncryptor", "EncryptionMetadata", "EncryptionAlgorithm", "KeyDerivation"]
\ No newline at end of file
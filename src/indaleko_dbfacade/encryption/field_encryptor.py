@@ -6,9 +6,11 @@ sensitive fields in database models.
 """
 
 import base64
+import functools
 import hashlib
 import hmac
 import json
+import math
 import os
 import secrets
 import sys
@@ -18,13 +20,19 @@ from enum import Enum
 from typing import Any, Dict, Optional, Tuple, Union, cast
 from uuid import UUID
 
+import orjson
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from ..config import DBFacadeConfig
 
+# Format written by encrypt_field: from 1.1 on, the ciphertext is bound to its
+# field UUID as associated data; 1.0 values were encrypted without it
+FORMAT_VERSION = "1.1"
+
 
 class EncryptionAlgorithm(str, Enum):
     """Supported encryption algorithms."""
@@ -33,6 +41,18 @@ class EncryptionAlgorithm(str, Enum):
     CHACHA20_POLY1305 = "ChaCha20-Poly1305"
 
 
+class KeyDerivation(str, Enum):
+    """
+    Supported per-field key derivation functions.
+    
+    PBKDF2 stretches a master key that may be a password; HKDF is a single
+    HMAC pass, suitable only when the master key is already random.
+    """
+    
+    PBKDF2 = "PBKDF2"
+    HKDF = "HKDF"
+
+
 @dataclass
 class EncryptionMetadata:
     """
@@ -57,6 +77,10 @@ class EncryptionMetadata:
     # Version of the encryption format
     version: str = "1.0"
     
+    # Function used to derive the field key; values written before it was
+    # recorded always used PBKDF2
+    key_derivation: KeyDerivation = KeyDerivation.PBKDF2
+    
     def to_dict(self) -> Dict[str, str]:
         """
         Convert metadata to a dictionary for storage.
@@ -70,6 +94,7 @@ class EncryptionMetadata:
             "salt": self.salt,
             "created_at": self.created_at,
             "version": self.version,
+            "key_derivation": self.key_derivation.value,
         }
     
     @classmethod
@@ -89,9 +114,55 @@ class EncryptionMetadata:
             salt=data["salt"],
             created_at=data["created_at"],
             version=data.get("version", "1.0"),
+            key_derivation=KeyDerivation(data.get("key_derivation", KeyDerivation.PBKDF2.value)),
         )
 
 
+def _has_non_finite(value: Any) -> bool:
+    """
+    Check whether a value holds a NaN or infinite float at any depth.
+    
+    Args:
+        value: The JSON-compatible value to check
+        
+    Returns:
+        True if any float in the value is not finite
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _serialize_value(value: Any) -> bytes:
+    """
+    Serialize a field value to JSON bytes that decode back to the same value.
+    
+    orjson is used where it is exact. Integers beyond 64 bits, which orjson
+    rejects, and non-finite floats, which it writes as null, are serialized
+    with the json module instead; decrypt_field reads both.
+    
+    Args:
+        value: The value to serialize
+        
+    Returns:
+        The serialized JSON bytes
+    """
+    try:
+        # Non-string keys become strings, as with the json module
+        value_bytes = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(value).encode("utf-8")
+    
+    # Only values that serialized a null can hold a non-finite float
+    if b"null" in value_bytes and _has_non_finite(value):
+        return json.dumps(value).encode("utf-8")
+    return value_bytes
+
+
 class FieldEncryptor:
     """
     Handles field-level encryption and decryption.
@@ -101,6 +172,10 @@ class FieldEncryptor:
     encryption keys for each field.
     """
     
+    # Process-wide instance returned by shared(), with the configuration
+    # version and environment key it was built from
+    _shared: Optional[Tuple[Tuple[int, Optional[str]], "FieldEncryptor"]] = None
+    
     def __init__(self, master_key: Optional[str] = None) -> None:
         """
         Initialize the field encryptor.
@@ -121,7 +196,38 @@ class FieldEncryptor:
         )
         
         # Key derivation parameters
+        self.key_derivation = KeyDerivation(
+            DBFacadeConfig.get("encryption.key_derivation", KeyDerivation.PBKDF2.value)
+        )
         self.key_iterations = DBFacadeConfig.get("encryption.key_iterations", 100000)
+        
+        # Salt for every field encrypted by this instance, so each field's key is
+        # derived once; a random IV per value keeps AES-GCM safe under a reused key
+        self._session_salt = os.urandom(16)
+        self._encoded_session_salt = base64.b64encode(self._session_salt).decode("utf-8")
+        
+        # Derived keys by (field UUID, salt, function); a PBKDF2 derivation is costly
+        self._cached_key = functools.lru_cache(maxsize=1024)(self._derive_key_uncached)
+    
+    @classmethod
+    def shared(cls) -> "FieldEncryptor":
+        """
+        Get the process-wide encryptor for the current configuration.
+        
+        Reusing one instance keeps its derived keys and session salt, so a
+        field's key is derived once per process rather than once per record.
+        A new instance is built when the configuration or the environment
+        key changes.
+        
+        Returns:
+            The shared field encryptor
+        """
+        version = (DBFacadeConfig.version(), os.environ.get("INDALEKO_ENCRYPTION_KEY"))
+        shared = cls._shared
+        if shared is None or shared[0] != version:
+            shared = (version, cls())
+            cls._shared = shared
+        return shared[1]
     
     def _get_master_key(self) -> str:
         """
@@ -147,16 +253,22 @@ class FieldEncryptor:
         # No key found
         return ""
     
-    def derive_key(self, field_uuid: UUID, salt: Optional[bytes] = None) -> Tuple[bytes, bytes]:
+    def derive_key(
+        self,
+        field_uuid: UUID,
+        salt: Optional[bytes] = None,
+        key_derivation: Optional[KeyDerivation] = None
+    ) -> Tuple[bytes, bytes]:
         """
         Derive an encryption key for a specific field.
         
-        This uses PBKDF2 to derive a unique key for each field based on
-        the master key and the field's UUID.
+        This derives a unique key for each field based on the master key
+        and the field's UUID.
         
         Args:
             field_uuid: UUID of the field
             salt: Optional salt for key derivation
+            key_derivation: Function to use; defaults to the configured one
             
         Returns:
             Tuple of (derived key, salt used)
@@ -164,10 +276,39 @@ class FieldEncryptor:
         # Generate a salt if not provided
         if salt is None:
             salt = os.urandom(16)
+        
+        if key_derivation is None:
+            key_derivation = self.key_derivation
+        
+        return self._cached_key(field_uuid, salt, key_derivation), salt
+    
+    def _derive_key_uncached(
+        self, field_uuid: UUID, salt: bytes, key_derivation: KeyDerivation
+    ) -> bytes:
+        """
+        Run the key derivation for a field and salt.
+        
+        Args:
+            field_uuid: UUID of the field
+            salt: Salt for key derivation
+            key_derivation: Function to derive the key with
             
+        Returns:
+            The derived key
+        """
         # Convert master key to bytes
         master_key_bytes = self.master_key.encode("utf-8")
         
+        # A random master key needs no stretching; the field UUID diversifies it
+        if key_derivation == KeyDerivation.HKDF:
+            hkdf = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,  # 256-bit key
+                salt=salt,
+                info=field_uuid.bytes,
+            )
+            return hkdf.derive(master_key_bytes)
+        
         # Mix in the field UUID
         field_specific_key = hashlib.sha256(
             master_key_bytes + str(field_uuid).encode("utf-8")
@@ -181,9 +322,7 @@ class FieldEncryptor:
             iterations=self.key_iterations,
             backend=default_backend(),
         )
-        key = kdf.derive(field_specific_key)
-        
-        return key, salt
+        return kdf.derive(field_specific_key)
     
     def encrypt_field(
         self, 
@@ -202,50 +341,68 @@ class FieldEncryptor:
         Returns:
             Dictionary containing the encrypted value and metadata
         """
+        return self.encrypt_fields({field_uuid: value}, algorithm)[field_uuid]
+    
+    def encrypt_fields(
+        self,
+        values: Dict[UUID, Any],
+        algorithm: Optional[EncryptionAlgorithm] = None
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Encrypt the field values of one record.
+        
+        Each field is still encrypted under its own key and IV, so values stay
+        individually decryptable; the salt, timestamp and algorithm checks are
+        done once for the whole record.
+        
+        Args:
+            values: The values to encrypt, by field UUID
+            algorithm: Optional encryption algorithm to use
+            
+        Returns:
+            Dictionary of encrypted value and metadata, by field UUID
+        """
         # Use default algorithm if not specified
         if algorithm is None:
             algorithm = EncryptionAlgorithm(self.default_algorithm)
-            
-        # Serialize the value to JSON
-        value_json = json.dumps(value)
-        value_bytes = value_json.encode("utf-8")
-        
-        # Generate a salt and derive a key
-        salt = os.urandom(16)
-        key, _ = self.derive_key(field_uuid, salt)
-        
-        # Generate a nonce/iv
-        iv = os.urandom(12)  # 96-bit IV for GCM mode
-        
-        # Encrypt the value
-        if algorithm == EncryptionAlgorithm.AES_GCM:
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(iv),
-                backend=default_backend(),
-            )
-            encryptor = cipher.encryptor()
-            ciphertext = encryptor.update(value_bytes) + encryptor.finalize()
-            
-            # Combine ciphertext and tag
-            encrypted_data = ciphertext + encryptor.tag
-        else:
+        
+        if algorithm != EncryptionAlgorithm.AES_GCM:
             # Implement other algorithms as needed
             raise ValueError(f"Unsupported encryption algorithm: {algorithm}")
+        
+        # Derive the keys with the session salt, reusing them after the first value
+        salt = self._session_salt
+        created_at = datetime.now(timezone.utc).isoformat()
+        
+        encrypted: Dict[UUID, Dict[str, Any]] = {}
+        for field_uuid, value in values.items():
+            # Serialize the value to JSON bytes
+            value_bytes = _serialize_value(value)
             
-        # Create metadata
-        metadata = EncryptionMetadata(
-            algorithm=algorithm,
-            iv=base64.b64encode(iv).decode("utf-8"),
-            salt=base64.b64encode(salt).decode("utf-8"),
-            created_at=datetime.now(timezone.utc).isoformat(),
-        )
+            key, _ = self.derive_key(field_uuid, salt, self.key_derivation)
+            
+            # Generate a nonce/iv
+            iv = os.urandom(12)  # 96-bit IV for GCM mode
+            
+            # Encrypt the value in one call; the result is the ciphertext followed by the tag
+            encrypted_data = AESGCM(key).encrypt(iv, value_bytes, field_uuid.bytes)
+            
+            # Create metadata
+            metadata = EncryptionMetadata(
+                algorithm=algorithm,
+                iv=base64.b64encode(iv).decode("utf-8"),
+                salt=self._encoded_session_salt,
+                created_at=created_at,
+                version=FORMAT_VERSION,
+                key_derivation=self.key_derivation,
+            )
+            
+            encrypted[field_uuid] = {
+                "value": base64.b64encode(encrypted_data).decode("utf-8"),
+                "metadata": metadata.to_dict(),
+            }
         
-        # Return encrypted value and metadata
-        return {
-            "value": base64.b64encode(encrypted_data).decode("utf-8"),
-            "metadata": metadata.to_dict(),
-        }
+        return encrypted
     
     def decrypt_field(self, encrypted_data: Dict[str, Any], field_uuid: UUID) -> Any:
         """
@@ -274,29 +431,23 @@ class FieldEncryptor:
         iv = base64.b64decode(metadata.iv)
         salt = base64.b64decode(metadata.salt)
         
-        # Derive the key
-        key, _ = self.derive_key(field_uuid, salt)
+        # Derive the key with the function recorded when the value was encrypted
+        key, _ = self.derive_key(field_uuid, salt, metadata.key_derivation)
         
-        # Decrypt the value
+        # Decrypt the value; the tag check also fails if it belongs to another field
         if metadata.algorithm == EncryptionAlgorithm.AES_GCM:
-            # Split ciphertext and tag
-            ciphertext = encrypted_value[:-16]
-            tag = encrypted_value[-16:]
-            
-            # Create the cipher
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(iv, tag),
-                backend=default_backend(),
-            )
-            decryptor = cipher.decryptor()
-            decrypted_bytes = decryptor.update(ciphertext) + decryptor.finalize()
+            associated_data = None if metadata.version == "1.0" else field_uuid.bytes
+            decrypted_bytes = AESGCM(key).decrypt(iv, encrypted_value, associated_data)
         else:
             # Implement other algorithms as needed
             raise ValueError(f"Unsupported encryption algorithm: {metadata.algorithm}")
             
-        # Deserialize the value from JSON
-        decrypted_value = json.loads(decrypted_bytes.decode("utf-8"))
+        # Deserialize the value from JSON; values written by the json module
+        # may hold NaN or Infinity, which only it can read back
+        try:
+            decrypted_value = orjson.loads(decrypted_bytes)
+        except orjson.JSONDecodeError:
+            decrypted_value = json.loads(decrypted_bytes)
         
         return decrypted_value
     
@@ -315,7 +466,7 @@ class FieldEncryptor:
             JSON string containing the encrypted value and metadata
         """
         encrypted_data = self.encrypt_field(value, field_uuid)
-        return json.dumps(encrypted_data)
+        return orjson.dumps(encrypted_data).decode()
     
     def decrypt_value(self, encrypted_json: str, field_uuid: UUID) -> Any:
         """
@@ -331,5 +482,5 @@ class FieldEncryptor:
         Returns:
             The decrypted value
         """
-        encrypted_data = json.loads(encrypted_json)
+        encrypted_data = orjson.loads(encrypted_json)
         return self.decrypt_field(encrypted_data, field_uuid)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Exception types for DB Facade.
+
+This module provides the exceptions raised by the DB Facade library, so
+callers can handle facade errors without catching unrelated ones.
+"""
+
+
+class DBFacadeError(Exception):
+    """Base class for all errors raised by DB Facade."""
+
+
+class UnknownUUIDError(DBFacadeError, KeyError):
+    """
+    Raised when a UUID has no label in the registry.
+    
+    Subclasses KeyError so existing lookups that catch KeyError still work.
+    """
+
+
+class RecordNotFoundError(DBFacadeError, ValueError):
+    """
+    Raised when a record cannot be retrieved from the database.
+    
+    Subclasses ValueError so existing callers that catch ValueError still work.
+    """
+
+
+class DBFacadeDBError(DBFacadeError):
+    """
+    Raised when a database operation fails.
+    
+    The original driver error is chained as the cause.
+    """
@@ -5,16 +5,32 @@ This module provides the foundation for database models with field obfuscation,
 allowing transparent mapping between semantic field names and UUIDs.
 """
 
-import os
+import functools
+import sys
+import types
+from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
-from typing import TypeVar, cast, get_type_hints
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator
+from pydantic import BaseModel, ConfigDict
 
 from ..config import DBFacadeConfig
 from ..registry.client import RegistryClient
 
+if TYPE_CHECKING:
+    from ..encryption import FieldEncryptor
+
 
 class ObfuscationLevel(Enum):
     """Enum defining the level of obfuscation to apply to a field."""
@@ -37,6 +53,8 @@ class ObfuscatedField:
     including obfuscation level and encryption settings.
     """
     
+    __slots__ = ("obfuscation_level", "description", "field_name")
+    
     def __init__(
         self,
         *,
@@ -67,6 +85,59 @@ class ObfuscatedField:
 
 T = TypeVar("T", bound="ObfuscatedModel")
 
+# Registry client shared by every model class, created on first use
+_registry_client: RegistryClient | None = None
+
+# Field types that model_dump returns unchanged, so their values can be read
+# straight from the instance
+_PLAIN_TYPES = frozenset({
+    str, int, float, bool, bytes, UUID, datetime, date, time, Decimal, type(None)
+})
+
+
+def _is_plain_annotation(annotation: object) -> bool:
+    """
+    Check whether model_dump returns values of a field type unchanged.
+    
+    Args:
+        annotation: The field's type annotation
+        
+    Returns:
+        True for the plain scalar types and optional unions of them
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        return all(_is_plain_annotation(arg) for arg in get_args(annotation))
+    return annotation in _PLAIN_TYPES
+
+
+@functools.cache
+def _encryptor_class() -> type["FieldEncryptor"]:
+    """
+    Import the encryptor class on first use.
+    
+    Importing the encryption module loads cryptography, so it is deferred
+    until a model actually encrypts or decrypts a field.
+    
+    Returns:
+        The FieldEncryptor class
+    """
+    from ..encryption import FieldEncryptor
+    return FieldEncryptor
+
+
+def _get_encryptor() -> "FieldEncryptor":
+    """
+    Get the shared field encryptor.
+    
+    The instance is cached by FieldEncryptor.shared(), which rebuilds it
+    when the configuration or encryption key changes, so it is not cached
+    again here.
+    
+    Returns:
+        The shared FieldEncryptor instance
+    """
+    return _encryptor_class().shared()
+
 
 class ObfuscatedModel(BaseModel):
     """
@@ -83,31 +154,68 @@ class ObfuscatedModel(BaseModel):
     # Class variable to store field metadata for obfuscation
     __obfuscated_fields__: dict[str, ObfuscatedField] = {}
     
-    # Registry client instance for this model
-    __registry_client: RegistryClient | None = None
+    # Per-class field name <-> UUID tables, filled from the registry on first use
+    _field_uuid_map: ClassVar[dict[str, UUID] | None] = None
+    _uuid_field_map: ClassVar[dict[str, str] | None] = None
+    
+    # Per-class storage plan: field name -> (UUID, stored key, marked for encryption)
+    _field_plan: ClassVar[dict[str, tuple[UUID, str, bool]] | None] = None
+    
+    # Per-class names of the fields marked for encryption, collected on first use
+    _encrypted_names: ClassVar[frozenset[str] | None] = None
+    
+    # Per-class flag: whether model_dump is a plain copy of the instance fields
+    _plain_dump: ClassVar[bool | None] = None
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Reset the cached UUID tables so a subclass never reuses its parent's.
+        
+        Args:
+            **kwargs: Keyword arguments passed to the parent hook
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_uuid_map = None
+        cls._uuid_field_map = None
+        cls._field_plan = None
+        cls._encrypted_names = None
+        cls._plain_dump = None
     
     @classmethod
     def _get_registry_client(cls) -> RegistryClient:
         """
-        Get or create the registry client instance.
+        Get or create the registry client shared by all models.
+        
+        The client is created on first use rather than at import, so
+        importing or defining a model does not require a registry
+        connection.
         
         Returns:
-            The registry client instance for this model
+            The shared registry client instance
         """
-        if cls.__registry_client is None:
-            # Create a new registry client
-            cls.__registry_client = RegistryClient()
+        global _registry_client
+        if _registry_client is None:
+            # Create the shared registry client
+            _registry_client = RegistryClient()
         
-        return cls.__registry_client
+        return _registry_client
     
     @classmethod
     def _collect_obfuscated_fields(cls) -> dict[str, ObfuscatedField]:
         """
         Collect all ObfuscatedField descriptors from the class.
         
+        The class is scanned once; the result is kept in the class's own
+        __dict__, so a subclass never picks up its parent's result.
+        
         Returns:
             Dictionary mapping field names to their ObfuscatedField instance
         """
+        cached = cls.__dict__.get("__obfuscated_fields__")
+        if cached is not None:
+            return cached
+        
         fields: dict[str, ObfuscatedField] = {}
         
         # Look through all class attributes
@@ -115,6 +223,12 @@ class ObfuscatedModel(BaseModel):
             if isinstance(value, ObfuscatedField):
                 fields[name] = value
         
+        # Pydantic moves a field's default out of the class body, so descriptors
+        # assigned to annotated fields are found on the field definitions
+        for name, field_info in cls.model_fields.items():
+            if isinstance(field_info.default, ObfuscatedField):
+                fields[name] = field_info.default
+        
         # Store the result in the class for future use
         cls.__obfuscated_fields__ = fields
         return fields
@@ -133,32 +247,143 @@ class ObfuscatedModel(BaseModel):
         # Get the registry client
         registry = cls._get_registry_client()
         
-        # Collect all field names that need obfuscation
+        # Collect all field names that need obfuscation, plus any fields
+        # defined using type annotations but not ObfuscatedField, skipping
+        # private attributes
         fields = cls._collect_obfuscated_fields()
-        field_names = set(fields.keys())
+        field_names = set(fields) | {
+            name for name in get_type_hints(cls) if not name.startswith("_")
+        }
         
-        # Add any fields defined using type annotations but not ObfuscatedField
-        hints = get_type_hints(cls)
-        for name in hints:
-            # Skip private attributes
-            if name.startswith("_") or name in field_names:
-                continue
+        # Register all fields, and the model class name itself, in one batch
+        return registry.get_uuids_for_labels([*field_names, cls.__name__])
+    
+    @classmethod
+    def _get_field_uuid_map(cls) -> dict[str, UUID]:
+        """
+        Get the field name to UUID table for this model, registering it once.
+        
+        The registry is only consulted on first use rather than at class
+        creation, so defining a model does not require a registry connection.
+        
+        Returns:
+            Dictionary mapping field names (and the class name) to their UUID
+        """
+        if cls._field_uuid_map is None:
+            cls._set_field_uuid_map(cls._register_model_schema())
+        return cls._field_uuid_map
+    
+    @classmethod
+    def _set_field_uuid_map(cls, mapping: dict[str, UUID]) -> None:
+        """
+        Store the field name to UUID table for this model and its inverse.
+        
+        The inverse is keyed by the UUID's string form, as stored in the
+        database, so resolving a stored key needs no UUID parsing. Those
+        strings are interned, as they key every dumped record. The
+        storage plan for every field is built at the same time, so dumps
+        never resolve a schema field themselves.
+        
+        Args:
+            mapping: Dictionary mapping field names (and the class name) to their UUID
+        """
+        keys = {name: sys.intern(str(uuid)) for name, uuid in mapping.items()}
+        cls._uuid_field_map = {key: name for name, key in keys.items()}
+        cls._field_uuid_map = mapping
+        cls._field_plan = {
+            name: (uuid, keys[name], cls._marked_encrypted(name))
+            for name, uuid in mapping.items()
+        }
+    
+    @classmethod
+    def _encrypted_field_names(cls) -> frozenset[str]:
+        """
+        Get the names of the fields marked for encryption.
+        
+        Returns:
+            The names of the fields whose descriptor asks for encryption
+        """
+        if cls._encrypted_names is None:
+            cls._encrypted_names = frozenset(
+                name for name, field in cls._collect_obfuscated_fields().items()
+                if field.obfuscation_level is ObfuscationLevel.ENCRYPTED
+            )
+        return cls._encrypted_names
+    
+    @classmethod
+    def _marked_encrypted(cls, name: str) -> bool:
+        """
+        Check whether a field is marked for encryption.
+        
+        Args:
+            name: The semantic field name
             
-            # Add to the set of fields to register
-            field_names.add(name)
+        Returns:
+            True if the field's descriptor asks for encryption
+        """
+        return name in cls._encrypted_field_names()
+    
+    @classmethod
+    def _uuid_for_field(cls, name: str) -> UUID:
+        """
+        Get the UUID for a field name, using the cached table when possible.
         
-        # Register all fields with the registry
-        mapping: dict[str, UUID] = {}
-        for name in field_names:
-            uuid = registry.get_uuid_for_label(name)
-            mapping[name] = uuid
+        Args:
+            name: The semantic field name
+            
+        Returns:
+            The UUID registered for the field name
+        """
+        mapping = cls._get_field_uuid_map()
+        if name in mapping:
+            return mapping[name]
+        return cls._get_registry_client().get_uuid_for_label(name)
+    
+    @classmethod
+    def _field_for_uuid(cls, uuid_obj: UUID) -> str:
+        """
+        Get the field name for a UUID, using the cached table when possible.
+        
+        Args:
+            uuid_obj: The UUID to look up
+            
+        Returns:
+            The semantic field name registered for the UUID
+        """
+        cls._get_field_uuid_map()
+        label = cls._uuid_field_map.get(str(uuid_obj))
+        if label is not None:
+            return label
+        return cls._get_registry_client().get_label_for_uuid(uuid_obj)
+    
+    @classmethod
+    def _plan_field(cls, name: str) -> tuple[UUID, str, bool]:
+        """
+        Get how a field is stored, resolving it on first use.
         
-        # Also register the model class name itself
-        model_name = cls.__name__
-        model_uuid = registry.get_uuid_for_label(model_name)
-        mapping[model_name] = model_uuid
+        The UUID, its string form and the field's encryption marking are
+        fixed for a model class, so each field is resolved once rather than
+        on every dump. Schema fields are planned when the schema is
+        registered; other names are added here.
         
-        return mapping
+        Args:
+            name: The semantic field name
+            
+        Returns:
+            Tuple of (field UUID, stored key, whether the field is marked for encryption)
+        """
+        plan = cls._field_plan
+        entry = plan.get(name) if plan is not None else None
+        if entry is None:
+            # Resolving the UUID may register the schema, which replaces the plan
+            uuid_obj = cls._uuid_for_field(name)
+            entry = cls._field_plan.get(name) if cls._field_plan is not None else None
+            if entry is None:
+                entry = (uuid_obj, sys.intern(str(uuid_obj)), cls._marked_encrypted(name))
+                if cls._field_plan is None:
+                    cls._field_plan = {}
+                cls._field_plan[name] = entry
+        return entry
     
     def _map_to_uuids(self, data: dict[str, object]) -> dict[str, object]:
         """
@@ -174,23 +399,24 @@ class ObfuscatedModel(BaseModel):
         Returns:
             Dictionary with UUID keys and encrypted sensitive fields
         """
-        # Get the registry client
-        registry = self._get_registry_client()
+        # Check if encryption is enabled and this model has fields to encrypt
+        encryption_enabled = (
+            DBFacadeConfig.is_encryption_enabled() and bool(self._encrypted_field_names())
+        )
         
-        # Check if encryption is enabled
-        encryption_enabled = DBFacadeConfig.is_encryption_enabled()
-        
-        # If encryption is enabled, create an encryptor
-        encryptor = None
-        if encryption_enabled:
-            from ..encryption import FieldEncryptor
-            encryptor = FieldEncryptor()
+        # If so, get the shared encryptor
+        encryptor = _get_encryptor() if encryption_enabled else None
         
         # Create a new dictionary with UUID keys
         uuid_data: dict[str, object] = {}
         
-        # Get the obfuscated field metadata
-        obfuscated_fields = self._collect_obfuscated_fields()
+        # Values to encrypt together once every key is mapped, and the
+        # stored key of each
+        to_encrypt: dict[UUID, object] = {}
+        encrypted_keys: dict[UUID, str] = {}
+        
+        # Storage plan for this class; None until the schema is registered
+        plan = self._field_plan
         
         # Convert each key to its UUID
         for key, value in data.items():
@@ -199,27 +425,26 @@ class ObfuscatedModel(BaseModel):
                 uuid_data[key] = value
                 continue
             
-            # Get the UUID for this field
+            # Get the UUID for this field, stored in its string representation
             try:
-                uuid_obj = registry.get_uuid_for_label(key)
-                uuid_key = str(uuid_obj)  # Use string representation for storage
+                entry = plan.get(key) if plan is not None else None
+                if entry is None:
+                    entry = self._plan_field(key)
+                    plan = self._field_plan
+                uuid_obj, uuid_key, marked_encrypted = entry
                 
                 # Check if this field should be encrypted
-                should_encrypt = (
-                    encryption_enabled and
-                    encryptor is not None and
-                    key in obfuscated_fields and
-                    obfuscated_fields[key].obfuscation_level.value == "encrypted"
-                )
+                should_encrypt = marked_encrypted and encryptor is not None
                 
                 # Handle datetime serialization
                 if hasattr(value, 'isoformat'):  # datetime objects
                     value = value.isoformat()
                 
                 if should_encrypt:
-                    # Encrypt the field value
-                    encrypted_value = encryptor.encrypt_field(value, uuid_obj)
-                    uuid_data[uuid_key] = encrypted_value
+                    # Reserve the key's position; the value is encrypted below
+                    uuid_data[uuid_key] = None
+                    to_encrypt[uuid_obj] = value
+                    encrypted_keys[uuid_obj] = uuid_key
                 else:
                     # Store the value as-is
                     uuid_data[uuid_key] = value
@@ -234,8 +459,39 @@ class ObfuscatedModel(BaseModel):
                     # In production, fail hard if a mapping is missing
                     raise
         
+        # Encrypt the record's sensitive fields in one batch
+        if encryptor is not None and to_encrypt:
+            for uuid_obj, encrypted_value in encryptor.encrypt_fields(to_encrypt).items():
+                uuid_data[encrypted_keys[uuid_obj]] = encrypted_value
+        
         return uuid_data
     
+    @classmethod
+    def _resolve_stored_key(cls, key: str) -> tuple[str, UUID] | None:
+        """
+        Resolve a stored field key to its semantic name and UUID.
+        
+        Schema fields are looked up by their stored key without parsing;
+        other keys are parsed as UUIDs and resolved through the registry.
+        
+        Args:
+            key: The stored field key, normally a UUID string
+            
+        Returns:
+            Tuple of (semantic name, field UUID), or None if the key is not
+            a UUID or is not registered
+        """
+        field_names = cls._uuid_field_map
+        label = field_names.get(key) if field_names is not None else None
+        if label is not None:
+            return label, cls._field_uuid_map[label]
+        
+        try:
+            uuid_obj = UUID(key)
+            return cls._field_for_uuid(uuid_obj), uuid_obj
+        except (ValueError, KeyError):
+            return None
+    
     def _map_to_semantic(self, data: dict[str, object]) -> dict[str, object]:
         """
         Map UUID field names back to semantic names and decrypt encrypted fields.
@@ -253,20 +509,17 @@ class ObfuscatedModel(BaseModel):
         if not DBFacadeConfig.is_dev_mode():
             return data
         
-        # Get the registry client
-        registry = self._get_registry_client()
-        
-        # Check if encryption is enabled
-        encryption_enabled = DBFacadeConfig.is_encryption_enabled()
+        # Check if encryption is enabled and this model has fields to encrypt
+        encryption_enabled = (
+            DBFacadeConfig.is_encryption_enabled() and bool(self._encrypted_field_names())
+        )
         
-        # If encryption is enabled, create an encryptor
-        encryptor = None
-        if encryption_enabled:
-            from ..encryption import FieldEncryptor
-            encryptor = FieldEncryptor()
+        # If so, get the shared encryptor
+        encryptor = _get_encryptor() if encryption_enabled else None
         
         # Create a new dictionary with semantic keys
         semantic_data: dict[str, object] = {}
+        encrypted_names = self._encrypted_field_names()
         
         # Convert each UUID key to its semantic name
         for key, value in data.items():
@@ -275,37 +528,64 @@ class ObfuscatedModel(BaseModel):
                 semantic_data[key] = value
                 continue
             
-            # Try to parse the key as a UUID
-            try:
-                uuid_obj = UUID(key)
-                label = registry.get_label_for_uuid(uuid_obj)
-                
-                # Check if this might be an encrypted value
-                is_encrypted = (
-                    encryption_enabled and
-                    encryptor is not None and
-                    isinstance(value, dict) and
-                    "value" in value and
-                    "metadata" in value
-                )
-                
-                if is_encrypted:
-                    # Attempt to decrypt the value
-                    try:
-                        decrypted_value = encryptor.decrypt_field(value, uuid_obj)
-                        semantic_data[label] = decrypted_value
-                    except Exception:
-                        # If decryption fails, use the raw value
-                        semantic_data[label] = value
-                else:
-                    # Use the raw value
-                    semantic_data[label] = value
-            except (ValueError, KeyError):
+            resolved = self._resolve_stored_key(key)
+            if resolved is None:
                 # If not a valid UUID or not found, keep the original key
                 semantic_data[key] = value
+                continue
+            label, uuid_obj = resolved
+            
+            # Check if this might be an encrypted value; only fields marked
+            # for encryption are ever stored encrypted
+            is_encrypted = (
+                encryptor is not None and
+                label in encrypted_names and
+                isinstance(value, dict) and
+                "value" in value and
+                "metadata" in value
+            )
+            
+            if is_encrypted:
+                # Attempt to decrypt the value
+                try:
+                    decrypted_value = encryptor.decrypt_field(value, uuid_obj)
+                    semantic_data[label] = decrypted_value
+                except Exception:
+                    # If decryption fails, use the raw value
+                    semantic_data[label] = value
+            else:
+                # Use the raw value
+                semantic_data[label] = value
         
         return semantic_data
     
+    @classmethod
+    def _dump_is_plain(cls) -> bool:
+        """
+        Check whether model_dump returns the instance fields unchanged.
+        
+        This holds when every field has a plain scalar type and nothing
+        customizes serialization: no serializers, computed or excluded
+        fields, extra fields or model_dump override.
+        
+        Returns:
+            True if the instance __dict__ can stand in for model_dump()
+        """
+        if cls._plain_dump is None:
+            decorators = cls.__pydantic_decorators__
+            cls._plain_dump = (
+                cls.model_dump is ObfuscatedModel.model_dump
+                and not decorators.field_serializers
+                and not decorators.model_serializers
+                and not cls.model_computed_fields
+                and cls.model_config.get("extra") != "allow"
+                and all(
+                    not field.exclude and _is_plain_annotation(field.annotation)
+                    for field in cls.model_fields.values()
+                )
+            )
+        return cls._plain_dump
+    
     def get_obfuscated_data(self) -> dict[str, object]:
         """
         Get the obfuscated representation of this model.
@@ -316,30 +596,31 @@ class ObfuscatedModel(BaseModel):
         Returns:
             Dictionary with UUID keys and possibly encrypted values
         """
-        # Get a dictionary representation of the model
-        data = self.model_dump()
+        # Get a dictionary representation of the model; when dumping would
+        # return the stored values unchanged, read them directly instead
+        if self._dump_is_plain():
+            data = self.__dict__
+        else:
+            data = self.model_dump()
         
         # Map semantic names to UUIDs
         return self._map_to_uuids(data)
 
     def model_dump(self, **kwargs: object) -> dict[str, object]:
         """
-        Override model_dump to map UUIDs back to semantic names in dev mode.
+        Dump the model using its semantic field names.
+        
+        Instances always hold their fields under semantic names, so there are
+        no UUID keys to map back here; obfuscation happens in
+        get_obfuscated_data.
         
         Args:
             **kwargs: Keyword arguments to pass to the parent method
             
         Returns:
-            Dictionary representation of the model with appropriate keys
+            Dictionary representation of the model
         """
-        # Get the raw dictionary from the parent method
-        uuid_dict = super().model_dump(**kwargs)
-        
-        # In development mode, map UUIDs back to semantic names
-        if DBFacadeConfig.is_dev_mode():
-            return self._map_to_semantic(uuid_dict)
-        
-        return uuid_dict
+        return super().model_dump(**kwargs)
     
     @classmethod
     def create_from_semantic(cls: type[T], **data: object) -> T:
@@ -356,31 +637,34 @@ class ObfuscatedModel(BaseModel):
             A new model instance
         """
         # Map semantic field names to UUIDs
-        registry = cls._get_registry_client()
         uuid_data: dict[str, object] = {}
         
+        # Storage plan for this class; None until the schema is registered
+        plan = cls._field_plan
+        
         for key, value in data.items():
             # Skip private attributes
             if key.startswith("_"):
                 uuid_data[key] = value
                 continue
             
-            # Get the UUID for this field
+            # Handle datetime serialization
+            if hasattr(value, 'isoformat'):  # datetime objects
+                value = value.isoformat()
+            
+            # Planned fields need no registry lookup, so nothing can fail
+            entry = plan.get(key) if plan is not None else None
+            if entry is not None:
+                uuid_data[entry[1]] = value
+                continue
+            
+            # Otherwise resolve the field, registering the schema if needed
             try:
-                uuid = registry.get_uuid_for_label(key)
-                uuid_key = str(uuid)
-                
-                # Handle datetime serialization
-                if hasattr(value, 'isoformat'):  # datetime objects
-                    value = value.isoformat()
-                    
-                uuid_data[uuid_key] = value
+                uuid_data[cls._plan_field(key)[1]] = value
+                plan = cls._field_plan
             except Exception:
                 # In dev mode, allow using semantic names for convenience
                 if DBFacadeConfig.is_dev_mode():
-                    # Also handle datetime serialization in dev mode
-                    if hasattr(value, 'isoformat'):
-                        value = value.isoformat()
                     uuid_data[key] = value
                 else:
                     # In production, fail hard if a mapping is missing
@@ -407,7 +691,7 @@ class ObfuscatedModel(BaseModel):
         return cls(**data)
     
     @classmethod
-    def from_obfuscated(cls: type[T], data: dict[str, object]) -> T:
+    def from_obfuscated(cls: type[T], data: dict[str, object], validate: bool = True) -> T:
         """
         Create a model instance from obfuscated data.
         
@@ -415,26 +699,22 @@ class ObfuscatedModel(BaseModel):
         
         Args:
             data: Dictionary with UUID keys and possibly encrypted values
+            validate: Whether to validate the data; pass False to use
+                model_construct for trusted data read back from the database
             
         Returns:
             A new instance of the model with semantic field names
         """
         # In development mode, convert UUIDs back to semantic names
         if DBFacadeConfig.is_dev_mode():
-            registry = cls._get_registry_client()
             semantic_data = {}
             
             for uuid_key, value in data.items():
-                try:
-                    # Try to parse as UUID and get the semantic label
-                    uuid_obj = UUID(uuid_key)
-                    label = registry.get_label_for_uuid(uuid_obj)
-                    semantic_data[label] = value
-                except (ValueError, KeyError):
-                    # If not a valid UUID or not found, keep the original key
-                    semantic_data[uuid_key] = value
+                # If not a valid UUID or not found, keep the original key
+                resolved = cls._resolve_stored_key(uuid_key)
+                semantic_data[resolved[0] if resolved is not None else uuid_key] = value
             
-            return cls(**semantic_data)
+            return cls(**semantic_data) if validate else cls.model_construct(**semantic_data)
         else:
             # In production mode, use the UUID keys directly
-            return cls(**data)
\ No newline at end of file
+            return cls(**data) if validate else cls.model_construct(**data)
\ No newline at end of file
@@ -6,10 +6,17 @@ which maintains mappings between semantic labels and UUIDs.
 """
 
 import sys
+import threading
 import time
-from uuid import UUID, uuid4
+from collections.abc import Iterable
+from uuid import UUID
 
 from ..config import DBFacadeConfig
+from ..exceptions import UnknownUUIDError
+from ..uuid_pool import uuid4
+
+# ArangoDB error number for an insert rejected by a unique index
+_UNIQUE_CONSTRAINT_VIOLATED = 1210
 
 
 class RegistryClient:
@@ -20,6 +27,14 @@ class RegistryClient:
     and vice versa, as well as for registering new mappings.
     """
     
+    # Label/UUID caches shared by every client of the same registry, keyed by
+    # (database URL, database name, registry collection)
+    _shared_caches: dict[tuple[str, str, str], tuple[dict[str, UUID], dict[UUID, str]]] = {}
+    
+    # Lock per registry serializing the registration of new labels, so two
+    # threads never register the same label with different UUIDs
+    _registration_locks: dict[tuple[str, str, str], threading.Lock] = {}
+    
     def __init__(self, registry_collection: str = "dbfacade_registry", base_url: str | None = None) -> None:
         """
         Initialize the registry client.
@@ -31,12 +46,17 @@ class RegistryClient:
         self.base_url = base_url or DBFacadeConfig.get_registry_url()
         self.registry_collection_name = registry_collection
         
-        # Cache for mapping lookups to reduce registry service calls
-        self._label_to_uuid_cache: dict[str, tuple[UUID, float]] = {}
-        self._uuid_to_label_cache: dict[UUID, tuple[str, float]] = {}
-        
-        # Cache TTL in seconds
-        self._cache_ttl = DBFacadeConfig.get("registry.cache_ttl", 3600)
+        # Cache for mapping lookups to reduce registry service calls; a label
+        # never changes its UUID once registered, so entries need no expiry and
+        # clients created per request still start with a warm cache
+        cache_key = (
+            DBFacadeConfig.get_database_url(),
+            DBFacadeConfig.get_database_credentials()["database"],
+            registry_collection,
+        )
+        caches = self._shared_caches.get(cache_key)
+        self._registration_lock = self._registration_locks.setdefault(cache_key, threading.Lock())
+        self._label_to_uuid, self._uuid_to_label = caches if caches is not None else ({}, {})
         
         # Initialize database connection for registry storage
         try:
@@ -47,6 +67,61 @@ class RegistryClient:
         except Exception as e:
             print(f"Failed to initialize registry storage: {e}", file=sys.stderr)
             sys.exit(1)
+        
+        # The first client of a registry makes sure label lookups use an
+        # index and loads every mapping, so registered labels never need a
+        # lookup query
+        if caches is None:
+            self._ensure_label_index()
+            if DBFacadeConfig.get("registry.preload", True):
+                self._load_registry()
+            self._label_to_uuid, self._uuid_to_label = self._shared_caches.setdefault(
+                cache_key, (self._label_to_uuid, self._uuid_to_label)
+            )
+    
+    def _ensure_label_index(self) -> None:
+        """
+        Ensure the registry has an index on label.
+        
+        Documents are keyed by their UUID, so UUID lookups already use the
+        primary index. The label index is unique, so two processes can never
+        register the same label under different UUIDs.
+        """
+        # The driver is imported where it is used, so importing the client
+        # (and every model) does not load it
+        from arango.exceptions import ArangoError
+        
+        try:
+            # Creating an index that already exists returns the existing one
+            self.registry_collection.add_persistent_index(
+                fields=["label"], unique=True, name="registry_label_unique"
+            )
+        except ArangoError as e:
+            print(f"Failed to create registry label index: {e}", file=sys.stderr)
+            sys.exit(1)
+    
+    def _load_registry(self) -> None:
+        """
+        Load every registered mapping into the caches in one streamed query.
+        """
+        from arango.exceptions import ArangoError
+        
+        try:
+            cursor = self.db.db.aql.execute(
+                "FOR doc IN @@registry RETURN [doc.label, doc.uuid]",
+                bind_vars={"@registry": self.registry_collection_name},
+                batch_size=10000,
+                stream=True
+            )
+            
+            for label, uuid_str in cursor:
+                uuid_value = UUID(uuid_str)
+                self._label_to_uuid[label] = uuid_value
+                self._uuid_to_label[uuid_value] = label
+                
+        except ArangoError as e:
+            print(f"Failed to load registry mappings: {e}", file=sys.stderr)
+            sys.exit(1)
     
     def get_uuid_for_label(self, label: str) -> UUID:
         """
@@ -65,51 +140,132 @@ class RegistryClient:
             ValueError: If the label is invalid
         """
         # Check the cache first
-        if label in self._label_to_uuid_cache:
-            uuid_value, timestamp = self._label_to_uuid_cache[label]
-            if time.time() - timestamp < self._cache_ttl:
-                return uuid_value
+        uuid_value = self._label_to_uuid.get(label)
+        if uuid_value is not None:
+            return uuid_value
         
-        # Query the registry collection for the label
-        try:
-            # Look up the label in the registry
-            query = """
-            FOR doc IN dbfacade_registry
-            FILTER doc.label == @label
-            LIMIT 1
-            RETURN doc
-            """
-            
-            cursor = self.db.db.aql.execute(
-                query,
-                bind_vars={"label": label}
-            )
-            
-            results = list(cursor)
+        # Look up the label and register it if missing, through the batch
+        # path so registration is serialized with other threads
+        return self.get_uuids_for_labels((label,))[label]
+    
+    def get_uuids_for_labels(self, labels: Iterable[str]) -> dict[str, UUID]:
+        """
+        Get the UUIDs for several semantic labels in one round trip.
+        
+        Labels that are not already registered get a new UUID, as with
+        get_uuid_for_label.
+        
+        Args:
+            labels: The semantic labels to look up
             
-            if results:
-                # Label exists, get the UUID
-                uuid_value = UUID(results[0]["uuid"])
+        Returns:
+            Dictionary mapping each label to its UUID
+        """
+        uuids = {}
+        missing = []
+        for label in dict.fromkeys(labels):
+            uuid_value = self._label_to_uuid.get(label)
+            if uuid_value is None:
+                missing.append(label)
             else:
-                # Label doesn't exist, create a new mapping
-                uuid_value = uuid4()
-                document = {
-                    "_key": str(uuid_value),
+                uuids[label] = uuid_value
+        
+        if not missing:
+            return uuids
+        
+        # Only one thread registers new labels at a time
+        with self._registration_lock:
+            self._register_labels(missing, uuids)
+        
+        return uuids
+    
+    def _register_labels(self, labels: list[str], uuids: dict[str, UUID]) -> None:
+        """
+        Look up uncached labels, registering any that are missing.
+        
+        The caller must hold the registration lock.
+        
+        Args:
+            labels: The labels that were not in the cache
+            uuids: Dictionary to add each label's UUID to
+        """
+        # Another thread may have registered some labels while this one waited
+        missing = []
+        for label in labels:
+            uuid_value = self._label_to_uuid.get(label)
+            if uuid_value is None:
+                missing.append(label)
+            else:
+                uuids[label] = uuid_value
+        
+        if not missing:
+            return
+        
+        from arango.exceptions import ArangoError, ArangoServerError
+        
+        # Look up each uncached label and register it if missing, with all
+        # labels in a single query; unlike UPSERT, a label that is already
+        # registered is never rewritten
+        query = """
+        FOR pending IN @documents
+        LET existing = FIRST(
+            FOR doc IN @@registry
+            FILTER doc.label == pending.label
+            LIMIT 1
+            RETURN doc.uuid
+        )
+        LET created = (
+            FOR document IN (existing == null ? [pending] : [])
+            INSERT document INTO @@registry
+            RETURN NEW.uuid
+        )
+        RETURN [pending.label, existing != null ? existing : FIRST(created)]
+        """
+        
+        # The lock only covers this process. If another process registers one
+        # of the labels between the lookup and the insert, the unique index
+        # rejects the insert and the query is rolled back; running it again
+        # finds that mapping. Each retry follows such a registration, so there
+        # are at most as many retries as labels.
+        attempt = 0
+        while True:
+            created_at = time.time()
+            documents = []
+            for label in missing:
+                candidate = uuid4()
+                documents.append({
+                    "_key": str(candidate),
                     "label": label,
-                    "uuid": str(uuid_value),
-                    "created_at": time.time()
-                }
-                self.registry_collection.insert(document)
+                    "uuid": str(candidate),
+                    "created_at": created_at
+                })
             
-            # Update the caches
-            self._label_to_uuid_cache[label] = (uuid_value, time.time())
-            self._uuid_to_label_cache[uuid_value] = (label, time.time())
+            try:
+                cursor = self.db.db.aql.execute(
+                    query,
+                    bind_vars={"@registry": self.registry_collection_name, "documents": documents}
+                )
+                rows = list(cursor)
+                break
+                
+            except ArangoServerError as e:
+                if e.error_code == _UNIQUE_CONSTRAINT_VIOLATED and attempt < len(missing):
+                    attempt += 1
+                    continue
+                print(f"Failed to get UUIDs for {len(missing)} labels: {e}", file=sys.stderr)
+                sys.exit(1)
+            except ArangoError as e:
+                print(f"Failed to get UUIDs for {len(missing)} labels: {e}", file=sys.stderr)
+                sys.exit(1)
+        
+        for label, uuid_str in rows:
+            uuid_value = UUID(uuid_str)
             
-            return uuid_value
+            # Update the caches
+            self._label_to_uuid[label] = uuid_value
+            self._uuid_to_label[uuid_value] = label
             
-        except Exception as e:
-            print(f"Failed to get UUID for label '{label}': {e}", file=sys.stderr)
-            sys.exit(1)
+            uuids[label] = uuid_value
     
     def get_label_for_uuid(self, uuid: UUID) -> str:
         """
@@ -125,39 +281,25 @@ class RegistryClient:
             KeyError: If the UUID is not found
         """
         # Check the cache first
-        if uuid in self._uuid_to_label_cache:
-            label, timestamp = self._uuid_to_label_cache[uuid]
-            if time.time() - timestamp < self._cache_ttl:
-                return label
+        label = self._uuid_to_label.get(uuid)
+        if label is not None:
+            return label
         
-        # Query the registry collection for the UUID
+        # Fetch the mapping by key; registry documents are keyed by their UUID
         try:
-            # Look up the UUID in the registry
-            query = """
-            FOR doc IN dbfacade_registry
-            FILTER doc.uuid == @uuid
-            LIMIT 1
-            RETURN doc
-            """
+            document = self.registry_collection.get(str(uuid))
             
-            cursor = self.db.db.aql.execute(
-                query,
-                bind_vars={"uuid": str(uuid)}
-            )
-            
-            results = list(cursor)
-            
-            if results:
+            if document is not None:
                 # UUID exists, get the label
-                label = results[0]["label"]
+                label = document["label"]
                 
                 # Update the caches
-                self._label_to_uuid_cache[label] = (uuid, time.time())
-                self._uuid_to_label_cache[uuid] = (label, time.time())
+                self._label_to_uuid[label] = uuid
+                self._uuid_to_label[uuid] = label
                 
                 return label
             else:
-                raise KeyError(f"UUID {uuid} not found in registry")
+                raise UnknownUUIDError(f"UUID {uuid} not found in registry")
                 
         except KeyError:
             raise
@@ -165,6 +307,56 @@ class RegistryClient:
             print(f"Failed to get label for UUID '{uuid}': {e}", file=sys.stderr)
             sys.exit(1)
     
+    def get_labels_for_uuids(self, uuids: Iterable[UUID]) -> dict[UUID, str]:
+        """
+        Get the semantic labels for several UUIDs in one round trip.
+        
+        Args:
+            uuids: The UUIDs to look up
+            
+        Returns:
+            Dictionary mapping each registered UUID to its label; UUIDs that
+            are not in the registry are left out
+        """
+        labels = {}
+        missing = []
+        for uuid in dict.fromkeys(uuids):
+            label = self._uuid_to_label.get(uuid)
+            if label is None:
+                missing.append(uuid)
+            else:
+                labels[uuid] = label
+        
+        if not missing:
+            return labels
+        
+        from arango.exceptions import ArangoError
+        
+        # Fetch the uncached mappings by key; DOCUMENT() skips keys that do not exist
+        try:
+            cursor = self.db.db.aql.execute(
+                "FOR doc IN DOCUMENT(@registry, @keys) RETURN [doc.uuid, doc.label]",
+                bind_vars={
+                    "registry": self.registry_collection_name,
+                    "keys": [str(uuid) for uuid in missing]
+                }
+            )
+            
+            for uuid_str, label in cursor:
+                uuid = UUID(uuid_str)
+                
+                # Update the caches
+                self._label_to_uuid[label] = uuid
+                self._uuid_to_label[uuid] = label
+                
+                labels[uuid] = label
+                
+        except ArangoError as e:
+            print(f"Failed to get labels for {len(missing)} UUIDs: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        return labels
+    
     def register_model_schema(self, model_class: type) -> dict[str, UUID]:
         """
         Register a model schema and return the UUID mappings.
@@ -184,14 +376,10 @@ class RegistryClient:
         # Add the model class name itself
         field_names.add(model_class.__name__)
         
-        # Register each field and build the mapping
-        mapping = {}
-        for name in field_names:
-            mapping[name] = self.get_uuid_for_label(name)
-        
-        return mapping
+        # Register all fields in one batch and build the mapping
+        return self.get_uuids_for_labels(field_names)
     
     def clear_cache(self) -> None:
-        """Clear the label/UUID caches."""
-        self._label_to_uuid_cache.clear()
-        self._uuid_to_label_cache.clear()
\ No newline at end of file
+        """Clear the label/UUID caches, for every client of this registry."""
+        self._label_to_uuid.clear()
+        self._uuid_to_label.clear()
\ No newline at end of file
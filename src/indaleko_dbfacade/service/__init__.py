@@ -6,5 +6,6 @@ clients to interact with the database using obfuscated field names.
 """
 
 from .api import app, start_api, submit_record, run_query, get_record
+from .responses import ORJSONResponse
 
-__all__ = ["app", "start_api", "submit_record", "run_query", "get_record"]
\ No newline at end of file
+__all__ = ["app", "start_api", "submit_record", "run_query", "get_record", "ORJSONResponse"]
\ No newline at end of file
@@ -5,17 +5,30 @@ This module provides the REST API for the DB Facade service, allowing
 clients to interact with the database using obfuscated field names.
 """
 
-import sys
+import functools
+import logging
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Type, TypeVar, cast, Callable
+from typing import Annotated, Dict, Any, List, Optional, Type, cast, Callable, Awaitable
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, Field, ValidationError
 import uvicorn
 
 from ..config import DBFacadeConfig
+from ..db.arangodb import ArangoDBClient
+from ..db_facade_service import DBFacadeService
 from ..models import ObfuscatedModel
+from .responses import ORJSONResponse
+
+
+# Errors go through logging, so deployments choose where and whether they appear
+logger = logging.getLogger(__name__)
 
 
 # API models for requests and responses
@@ -34,6 +47,21 @@ class RecordResponse(BaseModel):
     stored_at: str
 
 
+class BulkRecordPayload(BaseModel):
+    """Payload for submitting several records to one collection."""
+    
+    collection: uuid.UUID  # UUID of the collection, not a name
+    data: List[Dict[str, Any]]  # One entry per record; all keys must be UUIDs
+
+
+class BulkRecordResponse(BaseModel):
+    """Response for a bulk record submission."""
+    
+    record_uuids: List[uuid.UUID]  # In the same order as the submitted records
+    collection: uuid.UUID
+    stored_at: str
+
+
 class QueryPayload(BaseModel):
     """Payload for querying records."""
     
@@ -50,27 +78,160 @@ class QueryResult(BaseModel):
     resolved_fields: Optional[Dict[str, str]] = None  # Only in dev_mode
 
 
+def json_body[P: BaseModel](
+    model_class: Type[P], decode_first: bool = False
+) -> Callable[[Request], Awaitable[P]]:
+    """
+    Build a dependency that parses a request body straight into a payload model.
+    
+    FastAPI's own body handling decodes the JSON and then validates the
+    resulting dict; model_validate_json does both in one pass. For payloads
+    dominated by long lists of dicts, decoding with orjson first measured
+    faster, so that path can be selected per endpoint.
+    
+    Args:
+        model_class: The payload model to validate against
+        decode_first: Decode with orjson, then validate the resulting dict
+        
+    Returns:
+        An async dependency returning the validated payload
+    """
+    async def parse(request: Request) -> P:
+        body = await request.body()
+        try:
+            if decode_first:
+                return model_class.model_validate(orjson.loads(body))
+            return model_class.model_validate_json(body)
+        except orjson.JSONDecodeError as e:
+            raise RequestValidationError(
+                [{"type": "json_invalid", "loc": ("body",), "msg": str(e), "input": {}}]
+            ) from e
+        except ValidationError as e:
+            raise RequestValidationError(e.errors(include_url=False)) from e
+    
+    return parse
+
+
+def json_body_schema(model_class: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Describe a json_body payload in the OpenAPI schema.
+    
+    Args:
+        model_class: The payload model
+        
+    Returns:
+        The openapi_extra entry documenting the request body
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model_class.model_json_schema()}},
+        }
+    }
+
+
+# Request bodies parsed by json_body, declared once as annotated dependencies
+RecordBody = Annotated[RecordPayload, Depends(json_body(RecordPayload))]
+BulkRecordBody = Annotated[
+    BulkRecordPayload, Depends(json_body(BulkRecordPayload, decode_first=True))
+]
+QueryBody = Annotated[QueryPayload, Depends(json_body(QueryPayload))]
+
+
+@functools.lru_cache(maxsize=1)
+def get_service() -> DBFacadeService:
+    """
+    Get the DB Facade Service shared by every request.
+    
+    The service, its database client and its registry caches are created
+    once per worker process rather than once per request.
+    
+    Returns:
+        The shared DB Facade Service
+    """
+    # Pass the client in so a connection failure raises rather than exiting
+    return DBFacadeService(db=ArangoDBClient())
+
+
+# Database connection dependency
+def get_db() -> ArangoDBClient:
+    """Get the shared service's database connection."""
+    return get_service().db
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create the shared service before the first request is accepted.
+    
+    Args:
+        app: The FastAPI application
+    """
+    # A worker that cannot reach the database fails at startup, not on a request
+    await run_in_threadpool(get_service)
+    yield
+
+
 # Initialize the FastAPI app
 app = FastAPI(
     title="DB Facade Service",
     description="A database obfuscation layer that protects semantic field names",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
-# Database connection dependency
-def get_db():
-    """Get a database connection."""
-    # Use the ArangoDB client
-    from ..db.arangodb import ArangoDBClient
+def _resolve_fields(record: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Map the UUID keys of a record to their semantic names.
+    
+    Blocks on the registry, so handlers run it in the thread pool.
     
-    # Return a new ArangoDB client instance
-    return ArangoDBClient()
+    Args:
+        record: Record data with UUID keys
+        
+    Returns:
+        Dictionary mapping UUIDs to semantic names
+    """
+    # Use the registry to resolve UUIDs to semantic field names
+    return get_service().resolve_uuid_fields(record)
+
+
+def _resolve_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rekey a record from UUIDs to semantic field names.
+    
+    Blocks on the registry, so handlers run it in the thread pool.
+    
+    Args:
+        record: Record data with UUID keys
+        
+    Returns:
+        The record data with semantic keys; unresolvable keys are kept as is
+    """
+    # Resolve all UUIDs in one batch; unresolvable keys are used as is
+    field_names = get_service().resolve_uuid_fields(record)
+    return {
+        field_names.get(field_uuid, field_uuid): value
+        for field_uuid, value in record.items()
+    }
 
 
 # API endpoints
-@app.post("/record", response_model=RecordResponse)
-def submit_record(payload: RecordPayload, db=Depends(get_db)) -> RecordResponse:
+# Hot endpoints return ORJSONResponse directly: the records are built from already
+# validated inputs, so response_model validation and jsonable_encoder add no safety.
+# They are async so body parsing and responses stay on the event loop; the database
+# driver is synchronous, so each blocking call is handed to the thread pool.
+@app.post(
+    "/record",
+    responses={200: {"model": RecordResponse}},
+    openapi_extra=json_body_schema(RecordPayload),
+)
+async def submit_record(
+    payload: RecordBody,
+    db=Depends(get_db)
+) -> ORJSONResponse:
     """
     Submit a record to the database.
     
@@ -83,17 +244,17 @@ def submit_record(payload: RecordPayload, db=Depends(get_db)) -> RecordResponse:
     """
     try:
         # Insert the record into the database
-        record_uuid = db.insert(payload.collection, payload.data)
+        record_uuid = await run_in_threadpool(db.insert, payload.collection, payload.data)
         
         # Return the response
-        return RecordResponse(
-            record_uuid=record_uuid,
-            collection=payload.collection,
-            stored_at=datetime.now(timezone.utc).isoformat(),
-        )
+        return ORJSONResponse({
+            "record_uuid": record_uuid,
+            "collection": payload.collection,
+            "stored_at": datetime.now(timezone.utc).isoformat(),
+        })
     except Exception as e:
         # Log the error and raise an HTTP exception
-        print(f"[ERROR] Failed to submit record: {e}", file=sys.stderr)
+        logger.error("Failed to submit record: %s", e)
         
         # In development mode, include the error details
         if DBFacadeConfig.is_dev_mode():
@@ -103,8 +264,56 @@ def submit_record(payload: RecordPayload, db=Depends(get_db)) -> RecordResponse:
             raise HTTPException(status_code=500, detail="Failed to submit record")
 
 
-@app.post("/query", response_model=QueryResult)
-def run_query(payload: QueryPayload, db=Depends(get_db)) -> QueryResult:
+@app.post(
+    "/records/bulk",
+    responses={200: {"model": BulkRecordResponse}},
+    openapi_extra=json_body_schema(BulkRecordPayload),
+)
+async def submit_records_bulk(
+    payload: BulkRecordBody,
+    db=Depends(get_db)
+) -> ORJSONResponse:
+    """
+    Submit several records to the database in one request.
+    
+    Args:
+        payload: Bulk payload containing the collection and a list of records
+        db: Database connection
+        
+    Returns:
+        Bulk record response with the record UUIDs
+    """
+    try:
+        # Insert all records into the database at once
+        record_uuids = await run_in_threadpool(db.insert_many, payload.collection, payload.data)
+        
+        # Return the response
+        return ORJSONResponse({
+            "record_uuids": record_uuids,
+            "collection": payload.collection,
+            "stored_at": datetime.now(timezone.utc).isoformat(),
+        })
+    except Exception as e:
+        # Log the error and raise an HTTP exception
+        logger.error("Failed to submit records: %s", e)
+        
+        # In development mode, include the error details
+        if DBFacadeConfig.is_dev_mode():
+            raise HTTPException(status_code=500, detail=str(e)) from e
+        else:
+            # In production, use a generic error message
+            raise HTTPException(status_code=500, detail="Failed to submit records") from e
+
+
+@app.post(
+    "/query",
+    responses={200: {"model": QueryResult}},
+    openapi_extra=json_body_schema(QueryPayload),
+)
+async def run_query(
+    payload: QueryBody,
+    db=Depends(get_db)
+) -> ORJSONResponse:
     """
     Run a query against the database.
     
@@ -117,33 +326,26 @@ def run_query(payload: QueryPayload, db=Depends(get_db)) -> QueryResult:
     """
     try:
         # Use dev_mode from payload if provided, otherwise use config
-        dev_mode = payload.dev_mode if payload.dev_mode is not None else DBFacadeConfig.is_dev_mode()
+        dev_mode = (
+            payload.dev_mode if payload.dev_mode is not None else DBFacadeConfig.is_dev_mode()
+        )
         
         # Run the query against the database
-        results = db.query(payload.collection, payload.filter, payload.limit)
+        results = await run_in_threadpool(
+            db.query, payload.collection, payload.filter, payload.limit
+        )
         
         # In development mode, resolve UUIDs to semantic field names
         resolved_fields = None
-        if dev_mode:
-            # Use the registry to resolve UUIDs to semantic field names
-            from ..db_facade_service import DBFacadeService
-            
-            # Create a DB Facade Service instance
-            service = DBFacadeService()
-            
-            # Check if we have results to resolve
-            if results and len(results) > 0:
-                # Use the first result to get field mappings
-                first_result = results[0]
-                
-                # Resolve UUIDs to semantic names
-                resolved_fields = service.resolve_uuid_fields(first_result)
+        if dev_mode and results:
+            # Use the first result to get field mappings
+            resolved_fields = await run_in_threadpool(_resolve_fields, results[0])
             
         # Return the query result
-        return QueryResult(results=results, resolved_fields=resolved_fields)
+        return ORJSONResponse({"results": results, "resolved_fields": resolved_fields})
     except Exception as e:
         # Log the error and raise an HTTP exception
-        print(f"[ERROR] Failed to run query: {e}", file=sys.stderr)
+        logger.error("Failed to run query: %s", e)
         
         # In development mode, include the error details
         if DBFacadeConfig.is_dev_mode():
@@ -153,13 +355,13 @@ def run_query(payload: QueryPayload, db=Depends(get_db)) -> QueryResult:
             raise HTTPException(status_code=500, detail="Failed to run query")
 
 
-@app.get("/record/{record_uuid}", response_model=Dict[str, Any])
-def get_record(
+@app.get("/record/{record_uuid}", responses={200: {"model": Dict[str, Any]}})
+async def get_record(
     record_uuid: uuid.UUID, 
     collection: uuid.UUID = Query(..., description="UUID of the collection"),
     dev_mode: bool = Query(None, description="Override development mode"),
     db=Depends(get_db)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get a record from the database.
     
@@ -177,34 +379,16 @@ def get_record(
         dev_mode = dev_mode if dev_mode is not None else DBFacadeConfig.is_dev_mode()
         
         # Get the record from the database
-        record = db.get(collection, record_uuid)
+        record = await run_in_threadpool(db.get, collection, record_uuid)
         
         # In development mode, resolve UUIDs to semantic field names
         if dev_mode:
-            # Use the registry to resolve UUIDs to semantic field names
-            from ..db_facade_service import DBFacadeService
-            
-            # Create a DB Facade Service instance
-            service = DBFacadeService()
-            
-            # Resolve UUIDs to semantic names and create a new dictionary
-            resolved_record = {}
+            record = await run_in_threadpool(_resolve_record, record)
             
-            for field_uuid, value in record.items():
-                try:
-                    field_name = service.registry.get_label_for_uuid(uuid.UUID(field_uuid))
-                    resolved_record[field_name] = value
-                except (ValueError, KeyError):
-                    # If we can't resolve the UUID, use it as is
-                    resolved_record[field_uuid] = value
-            
-            # Use the resolved record
-            record = resolved_record
-            
-        return record
+        return ORJSONResponse(record)
     except Exception as e:
         # Log the error and raise an HTTP exception
-        print(f"[ERROR] Failed to get record: {e}", file=sys.stderr)
+        logger.error("Failed to get record: %s", e)
         
         # In development mode, include the error details
         if DBFacadeConfig.is_dev_mode():
@@ -214,29 +398,40 @@ def get_record(
             raise HTTPException(status_code=404, detail="Record not found")
 
 
-@app.get("/health")
-def health_check() -> Dict[str, str]:
+@app.get("/health", responses={200: {"model": Dict[str, str]}})
+def health_check() -> ORJSONResponse:
     """
     Check the health of the service.
     
     Returns:
         Health status
     """
-    return {"status": "ok", "mode": DBFacadeConfig.get("mode")}
+    return ORJSONResponse({"status": "ok", "mode": DBFacadeConfig.get("mode")})
 
 
-def start_api(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> None:
+def start_api(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    reload: bool = False,
+    workers: int | None = None
+) -> None:
     """
     Start the API server.
     
+    uvicorn picks uvloop and httptools automatically when they are installed,
+    as they are with the uvicorn[standard] dependency.
+    
     Args:
         host: Host to bind to
         port: Port to bind to
         reload: Whether to enable auto-reload
+        workers: Number of worker processes; None lets uvicorn read
+            WEB_CONCURRENCY, falling back to a single process
     """
     uvicorn.run(
         "indaleko_dbfacade.service.api:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
     )
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Response classes for the DB Facade Service API.
+
+This module provides an orjson-backed JSON response class so that API
+payloads are serialized in native code rather than through the standard
+library json encoder.
+"""
+
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize types that orjson does not handle natively.
+    
+    Args:
+        obj: The object orjson could not serialize
+        
+    Returns:
+        A JSON-serializable representation of the object
+        
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        """
+        Render the response content as JSON bytes.
+        
+        Args:
+            content: The response content
+            
+        Returns:
+            The JSON-encoded content
+        """
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NAIVE_UTC)
@@ -0,0 +1,71 @@
+"""
+Tests for the ArangoDB client's shared connections.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from arango.exceptions import ArangoClientError
+
+from indaleko_dbfacade.config import DBFacadeConfig
+from indaleko_dbfacade.db import arangodb
+from indaleko_dbfacade.db.arangodb import ArangoDBClient
+from indaleko_dbfacade.exceptions import DBFacadeDBError
+
+
+class TestSharedConnections:
+    """Tests for connection sharing between ArangoDBClient instances."""
+    
+    def test_connection_closed_with_last_client(self) -> None:
+        """Test that closing one client leaves the shared connection open for the others."""
+        DBFacadeConfig.initialize()
+        
+        with patch.object(arangodb, "ArangoClient") as mock_client_class, \
+                patch.dict(arangodb._CONNECTIONS, clear=True), \
+                patch.dict(arangodb._CONNECTION_USERS, clear=True):
+            first = ArangoDBClient()
+            second = ArangoDBClient()
+            
+            # The second client reuses the first one's verified connection
+            mock_client_class.assert_called_once()
+            assert second.client is first.client
+            
+            # The password is not part of the connection key
+            password = DBFacadeConfig.get_database_credentials()["password"]
+            assert password not in first._connection_key
+            
+            first.close()
+            first.client.close.assert_not_called()
+            
+            # Closing twice does not release the other client's reference
+            first.close()
+            first.client.close.assert_not_called()
+            
+            second.close()
+            second.client.close.assert_called_once()
+            assert not arangodb._CONNECTIONS
+    
+    def test_failed_collection_check_releases_connection(self) -> None:
+        """Test that a client failing to check its collections drops its connection reference."""
+        DBFacadeConfig.initialize()
+        
+        with patch.object(arangodb, "ArangoClient") as mock_client_class, \
+                patch.dict(arangodb._CONNECTIONS, clear=True), \
+                patch.dict(arangodb._CONNECTION_USERS, clear=True):
+            database = mock_client_class.return_value.db.return_value
+            first = ArangoDBClient()
+            users = dict(arangodb._CONNECTION_USERS)
+            
+            # A client reusing the connection fails and leaves the count as it was
+            database.has_collection.side_effect = ArangoClientError("collections unavailable")
+            with pytest.raises(DBFacadeDBError):
+                ArangoDBClient()
+            assert arangodb._CONNECTION_USERS == users
+            first.client.close.assert_not_called()
+            
+            # Once the last client is gone, a failed client closes the connection it opened
+            first.close()
+            with pytest.raises(DBFacadeDBError):
+                ArangoDBClient()
+            assert not arangodb._CONNECTION_USERS
+            assert not arangodb._CONNECTIONS
@@ -2,15 +2,21 @@
 Tests for the FieldEncryptor class.
 """
 
+import base64
 import json
+import math
 import os
 import uuid
 from typing import Dict, Any, Optional, cast
 from unittest.mock import patch
 
 import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-from indaleko_dbfacade.encryption import FieldEncryptor, EncryptionAlgorithm, EncryptionMetadata
+from indaleko_dbfacade.encryption import (
+    FieldEncryptor, EncryptionAlgorithm, EncryptionMetadata, KeyDerivation
+)
 from indaleko_dbfacade.config import DBFacadeConfig
 
 
@@ -96,6 +102,149 @@ class TestFieldEncryptor:
         # Check that keys for different fields are different
         assert key1a != key2
     
+    def test_encrypt_fields(self) -> None:
+        """Test encrypting the fields of a record in one batch."""
+        encryptor = FieldEncryptor(master_key="test-encryption-key")
+        values = {uuid.uuid4(): "secret", uuid.uuid4(): 42, uuid.uuid4(): [1, 2]}
+        
+        encrypted = encryptor.encrypt_fields(values)
+        
+        # Every field keeps its own IV and decrypts on its own
+        assert list(encrypted) == list(values)
+        ivs = {data["metadata"]["iv"] for data in encrypted.values()}
+        assert len(ivs) == len(values)
+        for field_uuid, value in values.items():
+            assert encryptor.decrypt_field(encrypted[field_uuid], field_uuid) == value
+    
+    def test_derived_keys_cached(self) -> None:
+        """Test that a field's key is derived once per salt and reused."""
+        encryptor = FieldEncryptor(master_key="test-encryption-key")
+        field_uuid = uuid.uuid4()
+        
+        # Values of one field share the session salt, so only the first derives a key
+        first = encryptor.encrypt_field("first", field_uuid)
+        second = encryptor.encrypt_field("second", field_uuid)
+        assert encryptor._cached_key.cache_info().misses == 1
+        assert first["metadata"]["salt"] == second["metadata"]["salt"]
+        assert first["metadata"]["iv"] != second["metadata"]["iv"]
+        
+        # Another instance has its own session salt but still decrypts by the stored salt
+        other = FieldEncryptor(master_key="test-encryption-key")
+        assert other.encrypt_field("third", field_uuid)["metadata"]["salt"] != first["metadata"]["salt"]
+        assert other.decrypt_field(first, field_uuid) == "first"
+        assert other.decrypt_field(second, field_uuid) == "second"
+    
+    def test_shared_encryptor(self) -> None:
+        """Test that the shared encryptor is reused until the configuration changes."""
+        os.environ["INDALEKO_MODE"] = "DEV"
+        DBFacadeConfig.initialize()
+        
+        encryptor = FieldEncryptor.shared()
+        assert FieldEncryptor.shared() is encryptor
+        
+        # Re-initializing the configuration builds a new instance
+        DBFacadeConfig.initialize()
+        assert FieldEncryptor.shared() is not encryptor
+    
+    def test_hkdf_key_derivation(self) -> None:
+        """Test that the configured key derivation is recorded and used to decrypt."""
+        field_uuid = uuid.uuid4()
+        pbkdf2_encryptor = FieldEncryptor(master_key="test-encryption-key")
+        pbkdf2_data = pbkdf2_encryptor.encrypt_field("old value", field_uuid)
+        assert pbkdf2_data["metadata"]["key_derivation"] == KeyDerivation.PBKDF2.value
+        
+        hkdf_encryptor = FieldEncryptor(master_key="test-encryption-key")
+        hkdf_encryptor.key_derivation = KeyDerivation.HKDF
+        hkdf_data = hkdf_encryptor.encrypt_field("new value", field_uuid)
+        assert hkdf_data["metadata"]["key_derivation"] == KeyDerivation.HKDF.value
+        
+        # Either encryptor decrypts both, by the function recorded with each value
+        assert pbkdf2_encryptor.decrypt_field(hkdf_data, field_uuid) == "new value"
+        assert hkdf_encryptor.decrypt_field(pbkdf2_data, field_uuid) == "old value"
+        
+        # Values written before the function was recorded were derived with PBKDF2
+        del pbkdf2_data["metadata"]["key_derivation"]
+        assert hkdf_encryptor.decrypt_field(pbkdf2_data, field_uuid) == "old value"
+    
+    def test_ciphertext_bound_to_field(self) -> None:
+        """Test that values only decrypt under their own field UUID."""
+        encryptor = FieldEncryptor(master_key="test-encryption-key")
+        field_uuid = uuid.uuid4()
+        other_uuid = uuid.uuid4()
+        
+        encrypted_data = encryptor.encrypt_field("secret", field_uuid)
+        assert encrypted_data["metadata"]["version"] == "1.1"
+        
+        # Same key material, different field: the tag check fails
+        with patch.object(encryptor, "derive_key", return_value=encryptor.derive_key(
+            field_uuid, base64.b64decode(encrypted_data["metadata"]["salt"])
+        )):
+            with pytest.raises(InvalidTag):
+                encryptor.decrypt_field(encrypted_data, other_uuid)
+        
+        # Version 1.0 values were encrypted without associated data and still decrypt
+        salt = os.urandom(16)
+        iv = os.urandom(12)
+        key, _ = encryptor.derive_key(field_uuid, salt)
+        legacy_data = {
+            "value": base64.b64encode(AESGCM(key).encrypt(iv, b'"legacy"', None)).decode("utf-8"),
+            "metadata": EncryptionMetadata(
+                algorithm=EncryptionAlgorithm.AES_GCM,
+                iv=base64.b64encode(iv).decode("utf-8"),
+                salt=base64.b64encode(salt).decode("utf-8"),
+                created_at="2023-01-01T00:00:00Z",
+                version="1.0",
+            ).to_dict(),
+        }
+        assert encryptor.decrypt_field(legacy_data, field_uuid) == "legacy"
+    
+    def test_json_compatible_serialization(self) -> None:
+        """Test that values serialize as they did with the json module."""
+        encryptor = FieldEncryptor(master_key="test-encryption-key")
+        field_uuid = uuid.uuid4()
+        
+        # Non-string keys become strings, as with json.dumps
+        encrypted_data = encryptor.encrypt_field({1: "one"}, field_uuid)
+        assert encryptor.decrypt_field(encrypted_data, field_uuid) == {"1": "one"}
+        
+        # Values written by json.dumps may hold NaN and still decrypt
+        salt = os.urandom(16)
+        iv = os.urandom(12)
+        key, _ = encryptor.derive_key(field_uuid, salt)
+        plaintext = json.dumps([float("nan"), 1.5]).encode("utf-8")
+        legacy_data = {
+            "value": base64.b64encode(
+                AESGCM(key).encrypt(iv, plaintext, field_uuid.bytes)
+            ).decode("utf-8"),
+            "metadata": EncryptionMetadata(
+                algorithm=EncryptionAlgorithm.AES_GCM,
+                iv=base64.b64encode(iv).decode("utf-8"),
+                salt=base64.b64encode(salt).decode("utf-8"),
+                created_at="2023-01-01T00:00:00Z",
+                version="1.1",
+            ).to_dict(),
+        }
+        decrypted_value = encryptor.decrypt_field(legacy_data, field_uuid)
+        assert math.isnan(decrypted_value[0])
+        assert decrypted_value[1] == 1.5
+    
+    def test_round_trip_values_orjson_cannot_represent(self) -> None:
+        """Test that non-finite floats and integers over 64 bits round-trip exactly."""
+        encryptor = FieldEncryptor(master_key="test-encryption-key")
+        field_uuid = uuid.uuid4()
+        
+        def round_trip(value: object) -> object:
+            return encryptor.decrypt_field(encryptor.encrypt_field(value, field_uuid), field_uuid)
+        
+        assert math.isnan(round_trip(float("nan")))
+        assert round_trip(float("inf")) == float("inf")
+        assert round_trip({"a": float("-inf"), "b": None}) == {"a": float("-inf"), "b": None}
+        assert round_trip(2**70) == 2**70
+        assert round_trip([-(2**70), 1]) == [-(2**70), 1]
+        
+        # Values orjson represents exactly, including nulls, are unchanged
+        assert round_trip({"a": None, "b": 1.5}) == {"a": None, "b": 1.5}
+    
     def test_string_convenience_methods(self) -> None:
         """Test convenience methods for string-based encryption/decryption."""
         # Create a field encryptor
@@ -5,7 +5,7 @@ Tests for encrypted fields in ObfuscatedModel.
 import os
 import uuid
 from typing import Dict, Any, Optional
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import Field
@@ -62,15 +62,18 @@ class TestEncryptedModel:
         model_uuid = uuid.uuid4()
         
         # Mock the registry client
-        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuid_for_label") as mock_get_uuid:
+        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuids_for_labels") as mock_get_uuids:
             # Configure the mock to return predictable UUIDs
-            mock_get_uuid.side_effect = lambda label: {
+            uuids = {
                 "username": username_uuid,
                 "password": password_uuid,
                 "api_key": api_key_uuid,
                 "public_flag": public_flag_uuid,
                 "SensitiveData": model_uuid,
-            }.get(label, uuid.uuid4())
+            }
+            mock_get_uuids.side_effect = lambda labels: {
+                label: uuids.get(label, uuid.uuid4()) for label in labels
+            }
             
             # Create a model instance
             data = SensitiveData.create_from_semantic(
@@ -113,14 +116,17 @@ class TestEncryptedModel:
         model_uuid = uuid.uuid4()
         
         # Mock the registry client
-        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuid_for_label") as mock_get_uuid:
+        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuids_for_labels") as mock_get_uuids:
             # Configure the mock to return predictable UUIDs
-            mock_get_uuid.side_effect = lambda label: {
+            uuids = {
                 "username": username_uuid,
                 "password": password_uuid,
                 "api_key": api_key_uuid,
                 "SensitiveData": model_uuid,
-            }.get(label, uuid.uuid4())
+            }
+            mock_get_uuids.side_effect = lambda labels: {
+                label: uuids.get(label, uuid.uuid4()) for label in labels
+            }
             
             # Create a model instance
             data = SensitiveData.create_from_semantic(
@@ -182,4 +188,30 @@ class TestEncryptedModel:
         # Fields should not be encrypted when encryption is disabled
         assert raw_data["username"] == "testuser"
         assert raw_data["password"] == "secret123"
-        assert raw_data["api_key"] == "api-key-12345"
\ No newline at end of file
+        assert raw_data["api_key"] == "api-key-12345"
+    
+    def test_encrypted_round_trip(self) -> None:
+        """Test that marked fields are encrypted on dump and decrypted on mapping back."""
+        
+        class Credentials(ObfuscatedModel):
+            username: str
+            password: str = ObfuscatedField(obfuscation_level=ObfuscationLevel.ENCRYPTED)
+        
+        registry = MagicMock()
+        registry.get_uuids_for_labels.side_effect = lambda labels: {
+            label: uuid.uuid5(uuid.NAMESPACE_OID, label) for label in labels
+        }
+        
+        with patch.object(Credentials, "_get_registry_client", return_value=registry):
+            credentials = Credentials(username="testuser", password="secret123")
+            stored = credentials.get_obfuscated_data()
+            
+            username_key = str(uuid.uuid5(uuid.NAMESPACE_OID, "username"))
+            password_key = str(uuid.uuid5(uuid.NAMESPACE_OID, "password"))
+            assert stored[username_key] == "testuser"
+            assert set(stored[password_key]) == {"value", "metadata"}
+            
+            # Only the marked field is decrypted; a look-alike plain value is kept
+            look_alike = {"value": "not-encrypted", "metadata": {}}
+            semantic = credentials._map_to_semantic({**stored, username_key: look_alike})
+            assert semantic == {"username": look_alike, "password": "secret123"}
@@ -31,20 +31,23 @@ class TestObfuscatedModel:
         test_uuid2 = uuid.uuid4()
         test_uuid3 = uuid.uuid4()
         
-        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuid_for_label") as mock_get_uuid:
+        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuids_for_labels") as mock_get_uuids:
             # Configure the mock to return predictable UUIDs
-            mock_get_uuid.side_effect = lambda label: {
+            uuids = {
                 "name": test_uuid1,
                 "email": test_uuid2,
                 "age": test_uuid3,
                 "User": uuid.uuid4(),  # Class name UUID
-            }.get(label, uuid.uuid4())
+            }
+            mock_get_uuids.side_effect = lambda labels: {
+                label: uuids.get(label, uuid.uuid4()) for label in labels
+            }
             
             # Create the model with semantic field names
             user = User.create_from_semantic(name="John Doe", email="john@example.com", age=30)
             
-            # Check that the UUID mapping was called
-            assert mock_get_uuid.call_count >= 3  # name, email, age
+            # Check that the UUID mapping was resolved in one batch
+            assert mock_get_uuids.call_count == 1
             
             # In dev mode, dumping should use semantic names
             user_dict = user.model_dump()
@@ -66,13 +69,16 @@ class TestObfuscatedModel:
         test_uuid1 = uuid.uuid4()
         test_uuid2 = uuid.uuid4()
         
-        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuid_for_label") as mock_get_uuid:
+        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuids_for_labels") as mock_get_uuids:
             # Configure the mock to return predictable UUIDs
-            mock_get_uuid.side_effect = lambda label: {
+            uuids = {
                 "name": test_uuid1,
                 "email": test_uuid2,
                 "User": uuid.uuid4(),  # Class name UUID
-            }.get(label, uuid.uuid4())
+            }
+            mock_get_uuids.side_effect = lambda labels: {
+                label: uuids.get(label, uuid.uuid4()) for label in labels
+            }
             
             # Create the model with semantic field names
             user = User.create_from_semantic(name="John Doe", email="john@example.com")
@@ -114,9 +120,9 @@ class TestObfuscatedModel:
         assert fields["public_data"].obfuscation_level == ObfuscationLevel.NONE
         
         # Test creating a model with these fields
-        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuid_for_label") as mock_get_uuid:
+        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuids_for_labels") as mock_get_uuids:
             # Configure the mock to return UUIDs
-            mock_get_uuid.return_value = uuid.uuid4()
+            mock_get_uuids.side_effect = lambda labels: {label: uuid.uuid4() for label in labels}
             
             # Create the model
             user = User.create_from_semantic(
@@ -142,9 +148,9 @@ class TestObfuscatedModel:
             description: Optional[str] = None
             tags: List[str] = Field(default_factory=list)
         
-        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuid_for_label") as mock_get_uuid:
+        with patch("indaleko_dbfacade.registry.client.RegistryClient.get_uuids_for_labels") as mock_get_uuids:
             # Configure the mock to return UUIDs
-            mock_get_uuid.return_value = uuid.uuid4()
+            mock_get_uuids.side_effect = lambda labels: {label: uuid.uuid4() for label in labels}
             
             # Register the model schema
             mapping = Product._register_model_schema()
@@ -156,5 +162,152 @@ class TestObfuscatedModel:
             assert "tags" in mapping
             assert "Product" in mapping  # Class name should also be registered
             
-            # Check that the UUIDs were retrieved
-            assert mock_get_uuid.call_count >= 5  # 4 fields + class name
\ No newline at end of file
+            # Check that the UUIDs were retrieved in one batch
+            mock_get_uuids.assert_called_once()
+            assert len(mapping) == 5  # 4 fields + class name
+    
+    def test_field_uuid_map_cached(self, dev_mode_env: None) -> None:
+        """Test that the field UUID table is fetched from the registry once per class."""
+        
+        class Item(ObfuscatedModel):
+            name: str
+            count: int = 0
+        
+        class Box(Item):
+            size: int = 0
+        
+        registry = MagicMock()
+        registry.get_uuids_for_labels.side_effect = lambda labels: {
+            label: uuid.uuid5(uuid.NAMESPACE_OID, label) for label in labels
+        }
+        
+        with patch.object(Item, "_get_registry_client", return_value=registry):
+            mapping = Item._get_field_uuid_map()
+            assert set(mapping) == {"name", "count", "Item"}
+            
+            # Registration plans the storage of every field up front
+            assert Item._field_plan["name"] == (mapping["name"], str(mapping["name"]), False)
+            calls = registry.get_uuids_for_labels.call_count
+            
+            # Repeated lookups in both directions use the cached tables
+            assert Item._uuid_for_field("name") == mapping["name"]
+            assert Item._field_for_uuid(mapping["count"]) == "count"
+            assert Item._get_field_uuid_map() is mapping
+            assert registry.get_uuids_for_labels.call_count == calls
+            registry.get_label_for_uuid.assert_not_called()
+            
+            # Subclasses build their own table rather than reusing the parent's
+            assert set(Box._get_field_uuid_map()) == {"name", "count", "size", "Box"}
+    
+    def test_obfuscated_data_uses_field_plan(self, dev_mode_env: None) -> None:
+        """Test that each field is resolved once and then dumped from the plan."""
+        DBFacadeConfig.initialize()
+        
+        class Gadget(ObfuscatedModel):
+            name: str
+            weight: float = 0.0
+        
+        registry = MagicMock()
+        registry.get_uuids_for_labels.side_effect = lambda labels: {
+            label: uuid.uuid5(uuid.NAMESPACE_OID, label) for label in labels
+        }
+        
+        with patch.object(Gadget, "_get_registry_client", return_value=registry):
+            name_key = str(uuid.uuid5(uuid.NAMESPACE_OID, "name"))
+            weight_key = str(uuid.uuid5(uuid.NAMESPACE_OID, "weight"))
+            
+            gadget = Gadget(name="lamp", weight=1.5)
+            assert gadget.get_obfuscated_data() == {name_key: "lamp", weight_key: 1.5}
+            
+            # Later dumps reuse the plan without resolving the fields again
+            with patch.object(Gadget, "_uuid_for_field") as mock_uuid_for_field:
+                assert Gadget(name="desk").get_obfuscated_data() == {name_key: "desk", weight_key: 0.0}
+                mock_uuid_for_field.assert_not_called()
+            
+            # Mapping back uses the reverse table without parsing the keys
+            with patch("indaleko_dbfacade.models.obfuscated_model.UUID") as mock_uuid:
+                semantic = gadget._map_to_semantic({name_key: "lamp", weight_key: 1.5})
+                assert semantic == {"name": "lamp", "weight": 1.5}
+                mock_uuid.assert_not_called()
+    
+    def test_obfuscated_fields_cached_per_class(self) -> None:
+        """Test that descriptors are collected once per class, including inherited fields."""
+        
+        class Account(ObfuscatedModel):
+            owner: str
+            token: str = ObfuscatedField(obfuscation_level=ObfuscationLevel.ENCRYPTED)
+        
+        class SharedAccount(Account):
+            members: int = 0
+        
+        fields = Account._collect_obfuscated_fields()
+        assert set(fields) == {"token"}
+        assert Account._collect_obfuscated_fields() is fields
+        
+        # The subclass collects its own result rather than reusing the parent's
+        subclass_fields = SharedAccount._collect_obfuscated_fields()
+        assert subclass_fields is not fields
+        assert set(subclass_fields) == {"token"}
+    
+    def test_no_encryptor_without_encrypted_fields(self, dev_mode_env: None) -> None:
+        """Test that models with no encrypted fields never need an encryptor."""
+        DBFacadeConfig.initialize()
+        
+        class Note(ObfuscatedModel):
+            text: str
+        
+        registry = MagicMock()
+        registry.get_uuids_for_labels.side_effect = lambda labels: {
+            label: uuid.uuid5(uuid.NAMESPACE_OID, label) for label in labels
+        }
+        
+        with patch.object(Note, "_get_registry_client", return_value=registry), \
+                patch.object(DBFacadeConfig, "is_encryption_enabled", return_value=True), \
+                patch("indaleko_dbfacade.encryption.FieldEncryptor.shared") as mock_shared:
+            note = Note(text="hello")
+            data = note.get_obfuscated_data()
+            assert note._map_to_semantic(data) == {"text": "hello"}
+            mock_shared.assert_not_called()
+    
+    def test_plain_models_skip_model_dump(self, dev_mode_env: None) -> None:
+        """Test that models of plain scalar fields are read without model_dump."""
+        DBFacadeConfig.initialize()
+        
+        class Reading(ObfuscatedModel):
+            sensor: str
+            value: Optional[float] = None
+        
+        class Batch(ObfuscatedModel):
+            readings: List[Reading]
+        
+        assert Reading._dump_is_plain()
+        assert not Batch._dump_is_plain()
+        
+        registry = MagicMock()
+        registry.get_uuids_for_labels.side_effect = lambda labels: {
+            label: uuid.uuid5(uuid.NAMESPACE_OID, label) for label in labels
+        }
+        
+        with patch.object(Reading, "_get_registry_client", return_value=registry):
+            reading = Reading(sensor="thermo", value=21.5)
+            with patch.object(ObfuscatedModel, "model_dump") as mock_dump:
+                data = reading.get_obfuscated_data()
+                mock_dump.assert_not_called()
+            assert reading._map_to_semantic(data) == {"sensor": "thermo", "value": 21.5}
+    
+    def test_registry_client_shared(self) -> None:
+        """Test that every model class uses the same registry client."""
+        from indaleko_dbfacade.models import obfuscated_model
+        
+        class Order(ObfuscatedModel):
+            total: float
+        
+        class Invoice(ObfuscatedModel):
+            amount: float
+        
+        with patch.object(obfuscated_model, "_registry_client", None), \
+                patch.object(obfuscated_model, "RegistryClient") as mock_client_class:
+            client = Order._get_registry_client()
+            assert Invoice._get_registry_client() is client
+            assert ObfuscatedModel._get_registry_client() is client
+            mock_client_class.assert_called_once_with()
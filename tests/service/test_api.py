@@ -11,7 +11,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from indaleko_dbfacade.config import DBFacadeConfig
-from indaleko_dbfacade.service.api import app
+from indaleko_dbfacade.service.api import app, get_db
 
 
 @pytest.fixture
@@ -138,4 +138,49 @@ class TestDBFacadeServiceAPI:
         # This should return a generic error instead of details
         response = client.get("/record/invalid-uuid?collection=invalid-uuid")
         assert response.status_code == 404
-        assert response.json()["detail"] == "Record not found"
\ No newline at end of file
+        assert response.json()["detail"] == "Record not found"
+    
+    def test_submit_records_bulk(self, client: TestClient) -> None:
+        """Test submitting several records in one request."""
+        
+        class BulkDB:
+            """Minimal database stand-in recording bulk inserts."""
+            
+            def __init__(self) -> None:
+                self.inserted: list = []
+            
+            def insert_many(self, collection_uuid: uuid.UUID, records: list) -> list:
+                self.inserted.append((collection_uuid, records))
+                return [uuid.uuid4() for _ in records]
+        
+        db = BulkDB()
+        app.dependency_overrides[get_db] = lambda: db
+        try:
+            collection_uuid = uuid.uuid4()
+            records = [{str(uuid.uuid4()): f"value{i}"} for i in range(3)]
+            
+            response = client.post(
+                "/records/bulk",
+                json={"collection": str(collection_uuid), "data": records},
+            )
+        finally:
+            app.dependency_overrides.clear()
+        
+        # Check the response
+        assert response.status_code == 200
+        response_data = response.json()
+        assert len(response_data["record_uuids"]) == 3
+        assert response_data["collection"] == str(collection_uuid)
+        assert "stored_at" in response_data
+        
+        # All records went to the database in a single call
+        assert db.inserted == [(collection_uuid, records)]
+    
+    def test_invalid_payload_rejected(self, client: TestClient) -> None:
+        """Test that malformed request bodies are rejected before reaching the database."""
+        response = client.post("/record", json={"collection": "not-a-uuid", "data": {}})
+        assert response.status_code == 422
+        
+        response = client.post("/query", content=b"{not json")
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
@@ -0,0 +1,50 @@
+"""
+Tests for the DB Facade Service API response classes.
+"""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+
+import orjson
+from pydantic import BaseModel
+
+from indaleko_dbfacade.service.responses import ORJSONResponse
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class _Payload(BaseModel):
+    name: str
+    record_uuid: uuid.UUID
+
+
+class TestORJSONResponse:
+    """Tests for the ORJSONResponse class."""
+    
+    def test_render_native_types(self) -> None:
+        """Test rendering UUIDs, enums and naive datetimes."""
+        record_uuid = uuid.uuid4()
+        response = ORJSONResponse(
+            {
+                "record_uuid": record_uuid,
+                "color": _Color.RED,
+                "stored_at": datetime(2025, 1, 1, 12, 0, 0),
+            }
+        )
+        
+        body = orjson.loads(response.body)
+        assert body["record_uuid"] == str(record_uuid)
+        assert body["color"] == "red"
+        assert body["stored_at"] == "2025-01-01T12:00:00+00:00"
+        assert response.media_type == "application/json"
+    
+    def test_render_pydantic_model(self) -> None:
+        """Test rendering a nested pydantic model."""
+        record_uuid = uuid.uuid4()
+        response = ORJSONResponse({"item": _Payload(name="widget", record_uuid=record_uuid)})
+        
+        body = orjson.loads(response.body)
+        assert body["item"] == {"name": "widget", "record_uuid": str(record_uuid)}
@@ -95,8 +95,9 @@ class TestDBFacadeConfig:
             # A value not in the file should use the default
             assert DBFacadeConfig.get("registry.url") == "http://localhost:8000"
         finally:
-            # Clean up the temporary file
+            # Clean up the temporary file and its JSON sidecar
             Path(config_path).unlink()
+            Path(config_path + ".json").unlink(missing_ok=True)
     
     def test_environment_overrides_file(self) -> None:
         """Test that environment variables override file configuration."""
@@ -123,8 +124,9 @@ class TestDBFacadeConfig:
             # Other values from the file should be used
             assert DBFacadeConfig.get("encryption.enabled") is False
         finally:
-            # Clean up the temporary file
+            # Clean up the temporary file and its JSON sidecar
             Path(config_path).unlink()
+            Path(config_path + ".json").unlink(missing_ok=True)
     
     def test_config_helpers(self) -> None:
         """Test the helper methods for commonly used configuration values."""
@@ -139,4 +141,160 @@ class TestDBFacadeConfig:
         assert DBFacadeConfig.is_dev_mode() is False
         assert DBFacadeConfig.is_encryption_enabled() is True
         assert DBFacadeConfig.get_registry_url() == "http://localhost:8000"
-        assert DBFacadeConfig.get_database_url() == "http://localhost:8529"
\ No newline at end of file
+        assert DBFacadeConfig.get_database_url() == "http://localhost:8529"
+    
+    def test_cached_flags_follow_reinitialize(self) -> None:
+        """Test that cached mode flags are invalidated when the config changes."""
+        os.environ["INDALEKO_MODE"] = "DEV"
+        DBFacadeConfig.initialize()
+        assert DBFacadeConfig.is_dev_mode() is True
+        version = DBFacadeConfig._config_version
+        
+        # Re-initializing bumps the version and the flags are recomputed
+        os.environ["INDALEKO_MODE"] = "PROD"
+        os.environ["INDALEKO_ENCRYPTION_ENABLED"] = "true"
+        DBFacadeConfig.initialize()
+        assert DBFacadeConfig._config_version > version
+        assert DBFacadeConfig.is_dev_mode() is False
+        assert DBFacadeConfig.is_encryption_enabled() is True
+    
+    def test_cached_flags_follow_reset(self) -> None:
+        """Test that cached mode flags are not reused after the config is reset."""
+        os.environ["INDALEKO_MODE"] = "DEV"
+        DBFacadeConfig.initialize()
+        assert DBFacadeConfig.is_dev_mode() is True
+        
+        # A reset configuration is re-initialized before the flags are read
+        DBFacadeConfig._initialized = False
+        os.environ["INDALEKO_MODE"] = "PROD"
+        assert DBFacadeConfig.is_dev_mode() is False
+        assert DBFacadeConfig.get("mode") == "PROD"
+    
+    def test_initialize_with_config_and_secrets(self) -> None:
+        """Test loading a config file and a secrets file in one initialize call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(yaml.dump({
+                "mode": "DEV",
+                "database": {"url": "http://file-db.example.com:8529"}
+            }))
+            secrets_path = Path(tmpdir) / "secrets.yaml"
+            secrets_path.write_text(yaml.dump({
+                "database": {"password": "s3cret", "url": "http://secret-db.example.com:8529"}
+            }))
+            
+            os.environ["INDALEKO_MODE"] = "PROD"
+            DBFacadeConfig.initialize(config_path=str(config_path), secrets_path=str(secrets_path))
+            
+            # Secrets are merged into the file's sections
+            assert DBFacadeConfig.get("database.password") == "s3cret"
+            assert DBFacadeConfig.get("database.url") == "http://secret-db.example.com:8529"
+            
+            # Environment variables still take precedence over both files
+            assert DBFacadeConfig.get("mode") == "PROD"
+    
+    def test_yaml_reparsed_only_when_changed(self) -> None:
+        """Test that cached YAML parses are reused until the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(yaml.dump({"database": {"url": "http://file-db:8529"}}))
+            secrets_path = Path(tmpdir) / "secrets.yaml"
+            secrets_path.write_text(yaml.dump({"database": {"password": "first"}}))
+            
+            DBFacadeConfig.initialize(config_path=str(config_path), secrets_path=str(secrets_path))
+            hits = DBFacadeConfig._parse_yaml.cache_info().hits
+            
+            # Rewriting the secrets file invalidates only its cached parse
+            secrets_path.write_text(yaml.dump({"database": {"url": "http://secret-db:8529"}}))
+            os.utime(secrets_path, ns=(0, secrets_path.stat().st_mtime_ns + 1))
+            DBFacadeConfig.initialize(config_path=str(config_path), secrets_path=str(secrets_path))
+            assert DBFacadeConfig._parse_yaml.cache_info().hits == hits + 1
+            assert DBFacadeConfig.get("database.url") == "http://secret-db:8529"
+            
+            # Secrets merged into the file's section must not leak into its cached parse
+            DBFacadeConfig.initialize(config_path=str(config_path))
+            assert DBFacadeConfig.get("database.url") == "http://file-db:8529"
+            assert DBFacadeConfig.get("database.password") is None
+    
+    def test_yaml_rewrite_with_same_mtime_reparsed(self) -> None:
+        """Test that a rewrite within the mtime granularity is still picked up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(yaml.dump({"mode": "DEV"}))
+            mtime_ns = config_path.stat().st_mtime_ns
+            DBFacadeConfig.initialize(config_path=str(config_path))
+            
+            # Same timestamp, different contents and size
+            config_path.write_text(yaml.dump({"mode": "PROD", "extra": True}))
+            os.utime(config_path, ns=(mtime_ns, mtime_ns))
+            DBFacadeConfig.initialize(config_path=str(config_path))
+            assert DBFacadeConfig.get("mode") == "PROD"
+    
+    def test_fresh_default_is_independent(self) -> None:
+        """Test that each initialize() starts from unshared default values."""
+        DBFacadeConfig.initialize()
+        DBFacadeConfig._config["database"]["url"] = "http://changed:8529"
+        
+        DBFacadeConfig.initialize()
+        assert DBFacadeConfig.get("database.url") == "http://localhost:8529"
+        assert DBFacadeConfig._fresh_default() == DBFacadeConfig._default_config
+    
+    def test_get_cache_follows_config_changes(self) -> None:
+        """Test that memoized lookups are refreshed when the configuration changes."""
+        DBFacadeConfig.initialize()
+        assert DBFacadeConfig.get("database.url") == "http://localhost:8529"
+        assert DBFacadeConfig.get("database.missing", "fallback") == "fallback"
+        assert DBFacadeConfig.get("database.missing", "other") == "other"
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            secrets_path = Path(tmpdir) / "secrets.yaml"
+            secrets_path.write_text(yaml.dump({"database": {"url": "http://secret-db:8529"}}))
+            DBFacadeConfig.load_from_secrets_file(str(secrets_path))
+        
+        assert DBFacadeConfig.get("database.url") == "http://secret-db:8529"
+    
+    def test_environment_read_at_initialize(self) -> None:
+        """Test that environment changes apply on the next initialize(), not before."""
+        os.environ["INDALEKO_MODE"] = "DEV"
+        DBFacadeConfig.initialize()
+        
+        os.environ["INDALEKO_MODE"] = "PROD"
+        assert DBFacadeConfig.get("mode") == "DEV"
+        assert DBFacadeConfig._env["INDALEKO_MODE"] == "DEV"
+        
+        DBFacadeConfig.initialize()
+        assert DBFacadeConfig.get("mode") == "PROD"
+    
+    def test_config_json_sidecar(self) -> None:
+        """Test that config files get a JSON sidecar and secrets files do not."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(yaml.dump({"mode": "PROD", "database": {"url": "http://db:8529"}}))
+            secrets_path = Path(tmpdir) / "secrets.yaml"
+            secrets_path.write_text(yaml.dump({"database": {"password": "s3cret"}}))
+            
+            DBFacadeConfig.initialize(config_path=str(config_path), secrets_path=str(secrets_path))
+            sidecar = Path(str(config_path) + ".json")
+            assert sidecar.exists()
+            assert not Path(str(secrets_path) + ".json").exists()
+            
+            # A fresh process (no in-memory cache) loads the same values from the sidecar
+            DBFacadeConfig._parse_yaml.cache_clear()
+            DBFacadeConfig.initialize(config_path=str(config_path))
+            assert DBFacadeConfig.get("mode") == "PROD"
+            assert DBFacadeConfig.get("database.url") == "http://db:8529"
+            
+            # Editing the YAML makes the sidecar stale, so the YAML wins
+            config_path.write_text(yaml.dump({"mode": "DEV"}))
+            DBFacadeConfig._parse_yaml.cache_clear()
+            DBFacadeConfig.initialize(config_path=str(config_path))
+            assert DBFacadeConfig.get("mode") == "DEV"
+    
+    def test_config_json_sidecar_skipped_for_yaml_only_types(self) -> None:
+        """Test that values JSON cannot represent exactly are never cached as JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text("mode: DEV\nrelease: 2024-01-02\n")
+            
+            DBFacadeConfig.initialize(config_path=str(config_path))
+            assert not Path(str(config_path) + ".json").exists()
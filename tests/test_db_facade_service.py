@@ -10,6 +10,7 @@ import sys
 import uuid
 from datetime import datetime
 from typing import cast
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel, Field
@@ -19,6 +20,7 @@ from indaleko_dbfacade.models.obfuscated_model import ObfuscatedModel
 from indaleko_dbfacade.registry.client import RegistryClient
 from indaleko_dbfacade.db.arangodb import ArangoDBClient
 from indaleko_dbfacade.config import DBFacadeConfig
+from indaleko_dbfacade.exceptions import DBFacadeDBError
 
 
 # Test models (prefix underscore to avoid pytest collection warning)
@@ -99,6 +101,47 @@ def test_store_model(db_facade_service):
     assert isinstance(record_uuid, uuid.UUID)
 
 
+def test_store_models(db_facade_service):
+    """Test storing several models of different classes at once."""
+    author_id = uuid.uuid4()
+    models = [
+        _TestUserModel(username="bulkuser1", email="bulk1@example.com", age=30),
+        _TestPostModel(title="Bulk Post", content="Bulk content", author_id=author_id),
+        _TestUserModel(username="bulkuser2", email="bulk2@example.com", age=31),
+    ]
+    
+    # Store the models
+    record_uuids = db_facade_service.store_models(models)
+    
+    # Each record is returned in the order of its model and can be read back
+    assert len(record_uuids) == len(models)
+    assert db_facade_service.get_model(_TestUserModel, record_uuids[0]).username == "bulkuser1"
+    assert db_facade_service.get_model(_TestPostModel, record_uuids[1]).title == "Bulk Post"
+    assert db_facade_service.get_model(_TestUserModel, record_uuids[2]).username == "bulkuser2"
+
+
+def test_insert_many_rejects_duplicate_key(db_facade_service):
+    """Test that a rejected document fails the whole bulk insert."""
+    duplicate = uuid.uuid4()
+    collection_uuid = db_facade_service.registry.get_uuid_for_label("_TestUserModel")
+    
+    # Give both documents the same key so the second one is rejected
+    with patch("indaleko_dbfacade.db.arangodb.uuid4", return_value=duplicate):
+        with pytest.raises(DBFacadeDBError):
+            db_facade_service.db.insert_many(collection_uuid, [{"a": 1}, {"a": 2}])
+
+
+def test_bulk_update_and_delete_reject_missing_key(db_facade_service):
+    """Test that bulk updates and deletes fail on a missing key like single ones."""
+    collection_uuid = db_facade_service.registry.get_uuid_for_label("_TestUserModel")
+    missing = uuid.uuid4()
+    
+    with pytest.raises(DBFacadeDBError):
+        db_facade_service.db.update_many(collection_uuid, {missing: {"a": 1}})
+    with pytest.raises(DBFacadeDBError):
+        db_facade_service.db.delete_many(collection_uuid, [missing])
+
+
 def test_get_model(db_facade_service):
     """Test getting a model from the database."""
     # First store a model
@@ -220,18 +263,21 @@ def test_register_model_schema(db_facade_service):
     assert "username" in mapping
     assert "email" in mapping
     assert "age" in mapping
+    
+    # The model class keeps the inverse table for development mode
+    assert _TestUserModel._uuid_field_map[str(mapping["username"])] == "username"
 
 
 def test_fail_stop_behavior_db_init():
     """Test fail-stop behavior for database initialization."""
     # In the test environment, if we don't set up the proper config,
-    # the ArangoDBClient should fail with SystemExit
-    with pytest.raises(SystemExit) as excinfo:
+    # the ArangoDBClient should raise rather than exit the process
+    with pytest.raises(DBFacadeDBError) as excinfo:
         from indaleko_dbfacade.db.arangodb import ArangoDBClient
         ArangoDBClient()
     
-    # Check that the exit code is 1
-    assert excinfo.value.code == 1
+    # Check that the driver error is kept as the cause
+    assert excinfo.value.__cause__ is not None
 
 
 def test_fail_stop_behavior_registry_init():
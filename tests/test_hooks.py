@@ -0,0 +1,41 @@
+"""
+Tests for the pre-commit hook scripts.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "scripts" / "hooks"
+
+
+def _load_hook(name: str):
+    """Load a hook script as a module without running its main()."""
+    spec = importlib.util.spec_from_file_location(name, HOOKS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+SAMPLE = '''
+db.aql.execute("FOR doc IN c FILTER doc.owner == 1 RETURN doc")
+db.execute("FOR doc IN c SORT doc.created RETURN doc")
+db.execute(f"FOR doc IN c FILTER doc.x == {value} RETURN doc")
+logger.info(f"stored {record.name}")
+logging.error(f"failed {user.email} and {user.name}")
+'''
+
+
+class TestSemanticLeakageHook:
+    """Tests for check_semantic_leakage."""
+    
+    def test_hyperscan_matches_regex_scan(self) -> None:
+        """Test that the Hyperscan path finds the same matches as the regex path."""
+        pytest.importorskip("hyperscan")
+        hook = _load_hook("check_semantic_leakage")
+        
+        expected = (hook._scan(hook._DB_RE, SAMPLE), hook._scan(hook._LOG_RE, SAMPLE))
+        
+        assert expected[0] and expected[1]
+        assert hook._scan_hyperscan(SAMPLE) == expected
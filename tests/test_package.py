@@ -0,0 +1,61 @@
+"""
+Tests for the package-level exports.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import indaleko_dbfacade
+
+
+class TestPackageExports:
+    """Tests for the lazily loaded package exports."""
+    
+    def test_import_does_not_load_heavy_dependencies(self) -> None:
+        """Test that importing the package defers cryptography and FastAPI."""
+        code = (
+            "import sys, indaleko_dbfacade; "
+            "print(any(m in sys.modules for m in ('cryptography', 'fastapi')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+        
+        # Resolving the model export must not load them, or the database driver, either
+        code = (
+            "import sys, indaleko_dbfacade; "
+            "indaleko_dbfacade.ObfuscatedModel; "
+            "print(any(m in sys.modules for m in ('cryptography', 'fastapi', 'arango')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+    
+    def test_model_access_does_not_load_cryptography(self) -> None:
+        """Test that using ObfuscatedModel defers cryptography until a field is encrypted."""
+        code = (
+            "import sys, indaleko_dbfacade; "
+            "indaleko_dbfacade.ObfuscatedModel; "
+            "print('cryptography' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+    
+    def test_lazy_exports_resolve(self) -> None:
+        """Test that every name in __all__ can be accessed."""
+        from indaleko_dbfacade.encryption import FieldEncryptor
+        
+        for name in indaleko_dbfacade.__all__:
+            assert getattr(indaleko_dbfacade, name) is not None
+        assert indaleko_dbfacade.FieldEncryptor is FieldEncryptor
+    
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = indaleko_dbfacade.does_not_exist
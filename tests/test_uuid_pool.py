@@ -0,0 +1,55 @@
+"""
+Tests for pooled UUID generation.
+"""
+
+import os
+import uuid
+
+import pytest
+
+from indaleko_dbfacade import uuid_pool
+
+
+class TestUUIDPool:
+    """Tests for the pooled uuid4 generator."""
+    
+    def test_generates_valid_version4_uuids(self) -> None:
+        """Test that pooled UUIDs match what uuid.uuid4 produces."""
+        generated = [uuid_pool.uuid4() for _ in range(uuid_pool.SLAB_SIZE * 2 + 1)]
+        
+        for value in generated:
+            assert isinstance(value, uuid.UUID)
+            assert value.version == 4
+            assert value.variant == uuid.RFC_4122
+            assert uuid.UUID(str(value)) == value
+            assert hash(value) == hash(uuid.UUID(str(value)))
+        
+        # Values spanning several slabs are all distinct
+        assert len(set(generated)) == len(generated)
+    
+    def test_uuids_are_immutable(self) -> None:
+        """Test that pooled UUIDs keep the immutability of uuid.UUID."""
+        value = uuid_pool.uuid4()
+        with pytest.raises(TypeError):
+            value.int = 0
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_gets_fresh_uuids(self) -> None:
+        """Test that a forked child does not reuse UUIDs pooled by its parent."""
+        uuid_pool.uuid4()
+        parent_next = list(uuid_pool._pool)[:1]
+        
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, uuid_pool.uuid4().bytes)
+            os._exit(0)
+        
+        os.close(write_fd)
+        child_value = uuid.UUID(bytes=os.read(read_fd, 16))
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        
+        assert parent_next
+        assert child_value.int != parent_next[0]